@@ -0,0 +1,7 @@
+# Cache keys shared by the dashboard views and the invalidation signals. Kept
+# apart from views.py so registering the receivers doesn't import the views.
+DASHBOARD_CACHE_KEYS = {
+    'site_stats': 'dash:site-stats:v1',
+    'entity_stats': 'dash:entity-stats:v1',
+    'incident_stats': 'dash:incident-stats:v1',
+}
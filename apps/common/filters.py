@@ -0,0 +1,11 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+class QueryParamFilterBackend(DjangoFilterBackend):
+    """DjangoFilterBackend that skips building a FilterSet when no filter params are present"""
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_fields = getattr(view, 'filterset_fields', None)
+        if filterset_fields and getattr(view, 'filterset_class', None) is None:
+            if not any(field in request.query_params for field in filterset_fields):
+                return queryset
+        return super().filter_queryset(request, queryset, view)
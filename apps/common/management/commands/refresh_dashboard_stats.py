@@ -0,0 +1,9 @@
+from django.core.management.base import BaseCommand
+from apps.common.stats import refresh_dashboard_snapshot
+
+class Command(BaseCommand):
+    help = 'Recompute the DashboardStats snapshot (schedule from cron every minute)'
+
+    def handle(self, *args, **options):
+        stats = refresh_dashboard_snapshot()
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {stats}'))
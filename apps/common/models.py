@@ -8,10 +8,37 @@ class DashboardStats(models.Model):
     total_incidents = models.IntegerField(default=0)
     operational_sites = models.IntegerField(default=0)
     maintenance_sites = models.IntegerField(default=0)
+    emergency_contacts = models.IntegerField(default=0)
+    open_incidents = models.IntegerField(default=0)
+    critical_incidents = models.IntegerField(default=0)
     last_updated = models.DateTimeField(auto_now=True)
 
+    SNAPSHOT_PK = 1
+
     class Meta:
         verbose_name_plural = "Dashboard Statistics"
 
     def __str__(self):
-        return f"Dashboard Stats - {self.last_updated.strftime('%Y-%m-%d %H:%M')}" 
\ No newline at end of file
+        return f"Dashboard Stats - {self.last_updated.strftime('%Y-%m-%d %H:%M')}"
+
+    def as_dict(self):
+        """Serialize the snapshot in the dashboard API shape"""
+        return {
+            'sites': {
+                'total': self.total_sites,
+                'operational': self.operational_sites,
+                'maintenance': self.maintenance_sites,
+            },
+            'entities': {
+                'total': self.total_entities,
+            },
+            'employees': {
+                'total': self.total_employees,
+                'emergency_contacts': self.emergency_contacts,
+            },
+            'incidents': {
+                'total': self.total_incidents,
+                'open': self.open_incidents,
+                'critical': self.critical_incidents,
+            },
+        }
@@ -0,0 +1,24 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.sites.models import Site
+from apps.companies.models import Entity
+from apps.employees.models import Employee, EmployeeLocation
+from apps.incidents.models import Incident
+from .cache_keys import DASHBOARD_CACHE_KEYS
+from .models import DashboardStats
+from .stats import reset_local_snapshot
+
+@receiver([post_save, post_delete], sender=Site)
+@receiver([post_save, post_delete], sender=Entity)
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=EmployeeLocation)
+@receiver([post_save, post_delete], sender=Incident)
+def invalidate_dashboard_stats(sender, **kwargs):
+    """Drop cached dashboard payloads whenever the underlying rows change"""
+    cache.delete_many(list(DASHBOARD_CACHE_KEYS.values()))
+
+@receiver(post_save, sender=DashboardStats)
+def reset_dashboard_snapshot(sender, **kwargs):
+    """Make the next read in this process pick up the rewritten snapshot row"""
+    reset_local_snapshot()
@@ -0,0 +1,89 @@
+from datetime import timedelta
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.companies.models import Company, Entity
+from apps.sites.models import Site
+from .models import DashboardStats
+from .stats import (
+    DASHBOARD_SNAPSHOT_MAX_AGE, SNAPSHOT_REFRESH_LOCK_KEY,
+    current_dashboard_snapshot, refresh_dashboard_snapshot, reset_local_snapshot
+)
+
+
+class DashboardCacheTests(APITestCase):
+    """Dashboard payload caching and signal-based invalidation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='dashboard')
+        cls.company = Company.objects.create()
+        cls.entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=cls.company)
+        Site.objects.create(name='North', site_code='N1', entity=cls.entity)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def site_total(self, response):
+        return sum(row['count'] for row in response.data['by_status'])
+
+    def test_repeat_request_is_served_from_cache(self):
+        first = self.client.get('/api/v1/dashboard/site-stats/')
+        with self.assertNumQueries(0):
+            second = self.client.get('/api/v1/dashboard/site-stats/')
+        self.assertEqual(second.data, first.data)
+
+    def test_site_write_invalidates_cached_payload(self):
+        self.assertEqual(self.site_total(self.client.get('/api/v1/dashboard/site-stats/')), 1)
+        Site.objects.create(name='South', site_code='S1', entity=self.entity)
+        self.assertEqual(self.site_total(self.client.get('/api/v1/dashboard/site-stats/')), 2)
+
+    def test_site_delete_invalidates_cached_payload(self):
+        self.client.get('/api/v1/dashboard/site-stats/')
+        Site.objects.get(site_code='N1').delete()
+        self.assertEqual(self.site_total(self.client.get('/api/v1/dashboard/site-stats/')), 0)
+
+
+class DashboardSnapshotTests(TestCase):
+    """Reads of the DashboardStats snapshot row"""
+
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create()
+        entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=company)
+        Site.objects.create(name='North', site_code='N1', entity=entity)
+
+    def setUp(self):
+        cache.clear()
+        reset_local_snapshot()
+
+    def make_stale_snapshot(self):
+        DashboardStats.objects.update_or_create(pk=DashboardStats.SNAPSHOT_PK, defaults={'total_sites': 0})
+        DashboardStats.objects.update(
+            last_updated=timezone.now() - timedelta(seconds=DASHBOARD_SNAPSHOT_MAX_AGE + 1)
+        )
+        reset_local_snapshot()
+
+    def test_missing_snapshot_is_built(self):
+        self.assertEqual(current_dashboard_snapshot().total_sites, 1)
+        self.assertTrue(DashboardStats.objects.filter(pk=DashboardStats.SNAPSHOT_PK).exists())
+
+    def test_fresh_snapshot_is_a_single_row_fetch(self):
+        refresh_dashboard_snapshot()
+        reset_local_snapshot()
+        with self.assertNumQueries(1):
+            self.assertEqual(current_dashboard_snapshot().total_sites, 1)
+
+    def test_stale_snapshot_is_served_while_another_reader_refreshes(self):
+        self.make_stale_snapshot()
+        cache.add(SNAPSHOT_REFRESH_LOCK_KEY, True)
+        with self.assertNumQueries(1):
+            self.assertEqual(current_dashboard_snapshot().total_sites, 0)
+
+    def test_stale_snapshot_is_refreshed_by_the_lock_holder(self):
+        self.make_stale_snapshot()
+        self.assertEqual(current_dashboard_snapshot().total_sites, 1)
+        self.assertIsNone(cache.get(SNAPSHOT_REFRESH_LOCK_KEY))
@@ -1,11 +1,19 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Count
+from django.core.cache import cache
 from apps.sites.models import Site
 from apps.companies.models import Entity
 from apps.employees.models import Employee
 from apps.incidents.models import Incident
+from .cache_keys import DASHBOARD_CACHE_KEYS
+from .stats import current_dashboard_snapshot, grouped_counts
+
+# Dashboards poll on a fixed cadence; keep the cached payloads around for
+# roughly one polling interval. Writes invalidate them early (see signals.py),
+# but that only reaches other workers when CACHES is a shared backend; with the
+# per-process fallback they can serve payloads up to this many seconds old.
+DASHBOARD_CACHE_TIMEOUT = 30
 
 class DashboardViewSet(viewsets.ViewSet):
     """ViewSet for dashboard functionality"""
@@ -13,92 +21,79 @@ class DashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'], url_path='stats')
     def dashboard_stats(self, request):
         """Get comprehensive dashboard statistics"""
-        # Site statistics
-        total_sites = Site.objects.filter(is_active=True).count()
-        operational_sites = Site.objects.filter(
-            is_active=True, operational_status='OPERATIONAL'
-        ).count()
-        maintenance_sites = Site.objects.filter(
-            is_active=True, operational_status='MAINTENANCE'
-        ).count()
-        
-        # Entity statistics
-        total_entities = Entity.objects.filter(is_active=True).count()
-        
-        # Employee statistics
-        total_employees = Employee.objects.filter(is_active=True).count()
-        emergency_contacts = Employee.objects.filter(
-            locations__show_in_emergency_contacts=True,
-            locations__is_active=True,
-            is_active=True
-        ).distinct().count()
-        
-        # Incident statistics
-        total_incidents = Incident.objects.filter(is_active=True).count()
-        open_incidents = Incident.objects.filter(
-            is_active=True, status='OPEN'
-        ).count()
-        critical_incidents = Incident.objects.filter(
-            is_active=True, severity='CRITICAL'
-        ).count()
-        
-        return Response({
-            'sites': {
-                'total': total_sites,
-                'operational': operational_sites,
-                'maintenance': maintenance_sites,
-            },
-            'entities': {
-                'total': total_entities,
-            },
-            'employees': {
-                'total': total_employees,
-                'emergency_contacts': emergency_contacts,
-            },
-            'incidents': {
-                'total': total_incidents,
-                'open': open_incidents,
-                'critical': critical_incidents,
-            },
-        })
+        # Served from the DashboardStats snapshot rather than the payload cache,
+        # so writes show up on the next snapshot refresh, not on invalidation
+        return Response(self._dashboard_stats())
 
     @action(detail=False, methods=['get'], url_path='site-stats')
     def site_stats(self, request):
         """Get detailed site statistics"""
-        sites_by_status = Site.objects.filter(is_active=True).values('operational_status').annotate(
-            count=Count('id')
-        )
-        sites_by_type = Site.objects.filter(is_active=True).values('plant_type').annotate(
-            count=Count('id')
+        data = cache.get_or_set(
+            DASHBOARD_CACHE_KEYS['site_stats'], self._site_stats, DASHBOARD_CACHE_TIMEOUT
         )
-        
-        return Response({
-            'by_status': list(sites_by_status),
-            'by_type': list(sites_by_type),
-        })
+        return Response(data)
 
     @action(detail=False, methods=['get'], url_path='entity-stats')
     def entity_stats(self, request):
         """Get detailed entity statistics"""
-        entities_by_type = Entity.objects.filter(is_active=True).values('entity_type').annotate(
-            count=Count('id')
+        data = cache.get_or_set(
+            DASHBOARD_CACHE_KEYS['entity_stats'], self._entity_stats, DASHBOARD_CACHE_TIMEOUT
         )
-        
-        return Response({
-            'by_type': list(entities_by_type),
-        })
+        return Response(data)
 
     @action(detail=False, methods=['get'], url_path='incident-stats')
     def incident_stats(self, request):
         """Get detailed incident statistics"""
-        incidents_by_severity = Incident.objects.filter(is_active=True).values('severity').annotate(
-            count=Count('id')
-        )
-        incidents_by_status = Incident.objects.filter(is_active=True).values('status').annotate(
-            count=Count('id')
+        data = cache.get_or_set(
+            DASHBOARD_CACHE_KEYS['incident_stats'], self._incident_stats, DASHBOARD_CACHE_TIMEOUT
         )
+        return Response(data)
+
+    @action(detail=False, methods=['get'], url_path='all')
+    def all_stats(self, request):
+        """Get all dashboard sections in one response, keyed like the individual endpoints"""
+        builders = {
+            'site_stats': self._site_stats,
+            'entity_stats': self._entity_stats,
+            'incident_stats': self._incident_stats,
+        }
+        cached = cache.get_many(DASHBOARD_CACHE_KEYS.values())
+        data, missing = {'stats': self._dashboard_stats()}, {}
+        for name, key in DASHBOARD_CACHE_KEYS.items():
+            if key in cached:
+                data[name] = cached[key]
+            else:
+                data[name] = missing[key] = builders[name]()
+        if missing:
+            cache.set_many(missing, DASHBOARD_CACHE_TIMEOUT)
+        return Response(data)
+
+    def _dashboard_stats(self):
+        """Read comprehensive dashboard statistics from the snapshot row"""
+        return current_dashboard_snapshot().as_dict()
+
+    def _site_stats(self):
+        """Compute detailed site statistics"""
+        counts = grouped_counts(Site.objects.filter(is_active=True), 'operational_status', 'plant_type')
+
+        return {
+            'by_status': counts['operational_status'],
+            'by_type': counts['plant_type'],
+        }
+
+    def _entity_stats(self):
+        """Compute detailed entity statistics"""
+        counts = grouped_counts(Entity.objects.filter(is_active=True), 'entity_type')
+
+        return {
+            'by_type': counts['entity_type'],
+        }
+
+    def _incident_stats(self):
+        """Compute detailed incident statistics"""
+        counts = grouped_counts(Incident.objects.filter(is_active=True), 'severity', 'status')
         
-        return Response({
-            'by_severity': list(incidents_by_severity),
-            'by_status': list(incidents_by_status),
-        }) 
\ No newline at end of file
+        return {
+            'by_severity': counts['severity'],
+            'by_status': counts['status'],
+        }
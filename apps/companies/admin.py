@@ -11,6 +11,7 @@ class CompanyAdmin(admin.ModelAdmin):
 @admin.register(Entity)
 class EntityAdmin(admin.ModelAdmin):
     list_display = ['name', 'entity_code', 'entity_type', 'company', 'city', 'state', 'is_active']
+    list_select_related = ['company']
     list_filter = ['entity_type', 'is_active', 'company', 'created_at']
     search_fields = ['name', 'entity_code', 'city', 'state']
     readonly_fields = ['created_at', 'updated_at'] 
\ No newline at end of file
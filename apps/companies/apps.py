@@ -2,4 +2,7 @@ from django.apps import AppConfig
 
 class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.companies' 
\ No newline at end of file
+    name = 'apps.companies'
+
+    def ready(self):
+        from . import signals  # noqa: F401
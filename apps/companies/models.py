@@ -1,7 +1,9 @@
 from django.db import models
 from django.conf import settings
-import qrcode
-import base64
+from django.core.cache import cache
+import hashlib
+import segno
+import pybase64
 from io import BytesIO
 
 class Company(models.Model):
@@ -24,23 +26,26 @@ class Company(models.Model):
     def __str__(self):
         return self.name
 
+    @property
+    def public_url(self):
+        return f"{settings.PUBLIC_QR_BASE}/{self.company_code}/headquarters"
+
+    def render_qr_code(self):
+        """Render the public URL QR code as a base64 PNG data URI"""
+        qr = segno.make(self.public_url, error='m')
+        return qr.png_data_uri(scale=10, border=5, dark='black', light='white')
+
     def generate_qr_data(self):
         """Generate QR code data for company"""
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(f"http://localhost:3000/public/{self.company_code}/headquarters")
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
+        # Keyed on the encoded URL, so a new company code or PUBLIC_QR_BASE gets a fresh entry
+        qr_code = cache.get_or_set(f"company_qr:{self.public_url}", self.render_qr_code, timeout=None)
         
         return {
-            'qr_code': f'data:image/png;base64,{img_str}',
+            'qr_code': qr_code,
             'company_data': {
                 'name': self.name,
                 'company_code': self.company_code,
-                'public_url': f"http://localhost:3000/public/{self.company_code}/headquarters"
+                'public_url': self.public_url
             }
         }
 
@@ -68,6 +73,7 @@ class Entity(models.Model):
     email = models.EmailField(blank=True)
     latitude = models.DecimalField(max_digits=10, decimal_places=7, null=True, blank=True)
     longitude = models.DecimalField(max_digits=10, decimal_places=7, null=True, blank=True)
+    qr_code_cache = models.TextField(blank=True, editable=False)  # base64 PNG data URI, rendered on save
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -76,28 +82,78 @@ class Entity(models.Model):
         app_label = 'companies'
         verbose_name_plural = "Entities"
         unique_together = ['company', 'entity_code']
+        indexes = [
+            models.Index(fields=['is_active', 'entity_type']),
+            # Matches EntityViewSet's default ordering so list pages skip the sort
+            models.Index(fields=['-created_at'], name='entity_created_desc_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.entity_code})"
 
+    @property
+    def public_url(self):
+        return f"{settings.PUBLIC_QR_BASE}/{self.company.company_code}/entity/{self.entity_code}"
+
+    # (company_id, entity_code) the stored qr_code_cache was rendered from. The
+    # company code itself is tracked by the Company post_save receiver.
+    _qr_source = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._qr_source = (instance.__dict__.get('company_id'), instance.__dict__.get('entity_code'))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Render the QR code on write, only when the URL it encodes has changed"""
+        update_fields = kwargs.get('update_fields')
+        sync_qr = update_fields is None or 'qr_code_cache' in update_fields
+        qr_source = (self.company_id, self.entity_code)
+        if sync_qr and (not self.qr_code_cache or self._qr_source != qr_source):
+            self.qr_code_cache = self.render_qr_code()
+        super().save(*args, **kwargs)
+        if sync_qr:
+            self._qr_source = qr_source
+
+    @property
+    def qr_digest(self):
+        """Short hash of the URL the QR image encodes; the image depends on nothing else"""
+        return hashlib.sha256(self.public_url.encode()).hexdigest()[:16]
+
+    @property
+    def qr_etag(self):
+        """Weak ETag for the QR image, changes whenever the encoded URL does"""
+        return f'W/"{self.qr_digest}"'
+
+    def write_qr_png(self, buffer):
+        """Write the public URL QR code as PNG into a binary buffer"""
+        qr = segno.make(self.public_url, error='m')
+        qr.save(buffer, kind='png', scale=10, border=5, dark='black', light='white')
+
+    def render_qr_png(self):
+        """Render the public URL QR code as raw PNG bytes"""
+        with BytesIO() as buffer:
+            self.write_qr_png(buffer)
+            return buffer.getvalue()
+
+    def render_qr_code(self):
+        """Render the public URL QR code as a base64 PNG data URI"""
+        with BytesIO() as buffer:
+            self.write_qr_png(buffer)
+            # Encode straight from the buffer's memory rather than a getvalue() copy
+            img_str = pybase64.b64encode(buffer.getbuffer()).decode('ascii')
+        return f'data:image/png;base64,{img_str}'
+
     def generate_qr_data(self):
         """Generate QR code data for entity"""
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}")
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-        
         return {
-            'qr_code': f'data:image/png;base64,{img_str}',
+            'qr_code': self.qr_code_cache or self.render_qr_code(),
             'entity_data': {
                 'name': self.name,
                 'entity_code': self.entity_code,
                 'company_name': self.company.name,
                 'company_code': self.company.company_code,
-                'public_url': f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}"
+                'public_url': self.public_url
             }
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 from .models import Company, Entity
 
 class CompanySerializer(serializers.ModelSerializer):
@@ -12,7 +13,7 @@ class EntitySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Entity
-        fields = '__all__'
+        exclude = ['qr_code_cache']
 
 class EntityListSerializer(serializers.ModelSerializer):
     company_name = serializers.CharField(source='company.name', read_only=True)
@@ -27,6 +28,8 @@ class EntityListSerializer(serializers.ModelSerializer):
 
 class EntityQRSerializer(serializers.ModelSerializer):
     qr_code = serializers.SerializerMethodField()
+    qr_code_url = serializers.SerializerMethodField()
+    public_url = serializers.CharField(read_only=True)
     company_name = serializers.CharField(source='company.name', read_only=True)
     company_code = serializers.CharField(source='company.company_code', read_only=True)
 
@@ -34,13 +37,11 @@ class EntityQRSerializer(serializers.ModelSerializer):
         model = Entity
         fields = [
             'id', 'name', 'entity_code', 'entity_type', 'company_name', 'company_code',
-            'qr_code', 'public_url'
+            'qr_code', 'qr_code_url', 'public_url'
         ]
 
     def get_qr_code(self, obj):
-        qr_data = obj.generate_qr_data()
-        return qr_data['qr_code']
+        return obj.qr_code_cache or obj.render_qr_code()
 
-    @property
-    def public_url(self):
-        return f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}" 
\ No newline at end of file
+    def get_qr_code_url(self, obj):
+        return reverse('entity-qr-png', kwargs={'pk': obj.pk}, request=self.context.get('request'))
\ No newline at end of file
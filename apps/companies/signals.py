@@ -0,0 +1,24 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+from .models import Company, Entity
+
+@receiver(pre_save, sender=Company)
+def remember_company_code(sender, instance, update_fields=None, **kwargs):
+    """Note the stored company code so post_save can tell whether it changed"""
+    instance._previous_company_code = None
+    if instance.pk and (update_fields is None or 'company_code' in update_fields):
+        instance._previous_company_code = sender.objects.filter(
+            pk=instance.pk
+        ).values_list('company_code', flat=True).first()
+
+@receiver(post_save, sender=Company)
+def rerender_entity_qr_codes(sender, instance, created, **kwargs):
+    """Entity QR codes encode the company code, so re-render the stored ones when it changes"""
+    previous = getattr(instance, '_previous_company_code', None)
+    if created or previous is None or previous == instance.company_code:
+        return
+    entities = list(instance.entities.all())
+    for entity in entities:
+        entity.company = instance
+        entity.qr_code_cache = entity.render_qr_code()
+    Entity.objects.bulk_update(entities, ['qr_code_cache'])
@@ -0,0 +1,90 @@
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from .models import Company, Entity
+
+
+class EntityQRCodeTests(TestCase):
+    """Stored entity QR codes follow the company code they encode"""
+
+    def setUp(self):
+        self.company = Company.objects.create(company_code='HEXA001')
+        self.entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=self.company)
+
+    def test_company_code_change_rerenders_entity_qr(self):
+        old_qr = self.entity.qr_code_cache
+        self.company.company_code = 'HEXA002'
+        self.company.save()
+
+        self.entity.refresh_from_db()
+        self.assertIn('/HEXA002/', self.entity.public_url)
+        self.assertNotEqual(self.entity.qr_code_cache, old_qr)
+        self.assertEqual(self.entity.qr_code_cache, self.entity.render_qr_code())
+
+    def test_unrelated_entity_save_skips_render(self):
+        entity = Entity.objects.get(pk=self.entity.pk)
+        entity.name = 'Renamed plant'
+        with mock.patch.object(Entity, 'render_qr_code') as render, \
+                CaptureQueriesContext(connection) as queries:
+            entity.save()
+        render.assert_not_called()
+        self.assertFalse(any('companies_company' in query['sql'] for query in queries))
+
+    def test_entity_code_change_rerenders_qr(self):
+        entity = Entity.objects.get(pk=self.entity.pk)
+        old_qr = entity.qr_code_cache
+        entity.entity_code = 'ENT2'
+        entity.save()
+
+        entity.refresh_from_db()
+        self.assertNotEqual(entity.qr_code_cache, old_qr)
+        self.assertEqual(entity.qr_code_cache, entity.render_qr_code())
+
+    def test_update_fields_without_qr_skip_render(self):
+        entity = Entity.objects.get(pk=self.entity.pk)
+        entity.entity_code = 'ENT2'
+        with mock.patch.object(Entity, 'render_qr_code') as render:
+            entity.save(update_fields=['entity_code'])
+        render.assert_not_called()
+
+    def test_other_company_changes_keep_entity_qr(self):
+        old_qr = self.entity.qr_code_cache
+        self.company.name = 'Renamed'
+        self.company.save()
+
+        self.entity.refresh_from_db()
+        self.assertEqual(self.entity.qr_code_cache, old_qr)
+
+
+class EntityQRPngTests(APITestCase):
+    """Conditional GETs of the entity QR image"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='qr')
+        cls.company = Company.objects.create(company_code='HEXA001')
+        cls.entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=cls.company)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/entities/{self.entity.pk}/qr-png/'
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_company_code_change_invalidates_etag(self):
+        first = self.client.get(self.url)
+        self.company.company_code = 'HEXA002'
+        self.company.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertNotEqual(response.content, first.content)
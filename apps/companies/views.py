@@ -1,14 +1,21 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.permissions import AllowAny
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.filters import QueryParamFilterBackend
 from rest_framework import filters
 from .models import Company, Entity
 from .serializers import (
     CompanySerializer, EntitySerializer, EntityListSerializer, EntityQRSerializer
 )
 
+QR_PNG_MAX_AGE = 60 * 60 * 24
+
 class CompanyViewSet(viewsets.ModelViewSet):
     """ViewSet for managing companies"""
     queryset = Company.objects.all()
@@ -34,19 +41,30 @@ class CompanyViewSet(viewsets.ModelViewSet):
             'company_code': company.company_code,
             'qr_code': qr_data['qr_code'],
             'company_data': qr_data['company_data'],
-            'public_url': f"http://localhost:3000/public/{company.company_code}/headquarters"
+            'public_url': company.public_url
         })
 
 class EntityViewSet(viewsets.ModelViewSet):
     """ViewSet for managing entities"""
     queryset = Entity.objects.select_related('company').all()
     serializer_class = EntitySerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['entity_type', 'is_active', 'company']
     search_fields = ['name', 'entity_code', 'city', 'state']
     ordering_fields = ['name', 'created_at', 'entity_code']
     ordering = ['-created_at']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Only load the columns EntityListSerializer renders, skipping the cached QR blob
+            queryset = queryset.only(
+                'id', 'name', 'entity_code', 'entity_type', 'city', 'state', 'country',
+                'is_active', 'created_at', 'updated_at',
+                'company__name', 'company__company_code'
+            )
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return EntityListSerializer
@@ -58,9 +76,24 @@ class EntityViewSet(viewsets.ModelViewSet):
     def generate_qr(self, request, pk=None):
         """Generate QR code for specific entity"""
         entity = self.get_object()
-        serializer = EntityQRSerializer(entity)
+        serializer = EntityQRSerializer(entity, context=self.get_serializer_context())
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], url_path='qr-png')
+    def qr_png(self, request, pk=None):
+        """Serve the entity QR code as a browser/CDN cacheable PNG"""
+        entity = self.get_object()
+        etag = entity.qr_etag
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponseNotModified()
+        else:
+            cache_key = f'entity-qr-png:{entity.qr_digest}'
+            png = cache.get_or_set(cache_key, entity.render_qr_png, QR_PNG_MAX_AGE)
+            response = HttpResponse(png, content_type='image/png')
+        response['ETag'] = etag
+        patch_cache_control(response, public=True, max_age=QR_PNG_MAX_AGE)
+        return response
+
     @action(detail=True, methods=['get'], url_path='qr-url')
     def generate_url_qr(self, request, pk=None):
         """Generate URL-based QR code for specific entity"""
@@ -73,6 +106,7 @@ class EntityViewSet(viewsets.ModelViewSet):
             'company_name': entity.company.name,
             'company_code': entity.company.company_code,
             'qr_code': qr_data['qr_code'],
+            'qr_code_url': reverse('entity-qr-png', kwargs={'pk': entity.pk}, request=request),
             'entity_data': qr_data['entity_data'],
-            'public_url': f"http://localhost:3000/public/{entity.company.company_code}/entity/{entity.entity_code}"
+            'public_url': entity.public_url
         }) 
\ No newline at end of file
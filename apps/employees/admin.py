@@ -17,6 +17,7 @@ class EmployeeAdmin(admin.ModelAdmin):
 @admin.register(EmployeeLocation)
 class EmployeeLocationAdmin(admin.ModelAdmin):
     list_display = ['employee', 'location_type', 'location_id', 'show_in_emergency_contacts', 'is_active']
+    list_select_related = ['employee']
     list_filter = ['location_type', 'show_in_emergency_contacts', 'is_active', 'created_at']
     search_fields = ['employee__name', 'location_id']
     readonly_fields = ['created_at', 'updated_at'] 
\ No newline at end of file
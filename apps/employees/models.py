@@ -1,5 +1,8 @@
 from django.db import models
+from django.db.models import Exists, OuterRef, Q
 from django.conf import settings
+from apps.companies.models import Entity
+from apps.sites.models import Site
 
 class Employee(models.Model):
     """Employee model - represents employees who can be deployed to multiple locations"""
@@ -20,41 +23,27 @@ class Employee(models.Model):
         return f"{self.name} ({self.employee_id})"
 
     @classmethod
-    def get_emergency_contacts_by_headquarters(cls):
-        """Get emergency contacts for headquarters"""
-        return cls.objects.filter(
-            employeelocation__location_type='headquarters',
-            employeelocation__show_in_emergency_contacts=True,
-            employeelocation__is_active=True,
-            is_active=True
-        ).distinct()
+    def emergency_contact_exists(cls, **location_filters):
+        """EXISTS subquery matching an active emergency-contact location of the outer employee"""
+        return Exists(EmployeeLocation.objects.filter(
+            employee=OuterRef('pk'),
+            show_in_emergency_contacts=True,
+            is_active=True,
+            **location_filters
+        ))
 
     @classmethod
-    def get_emergency_contacts_by_company(cls):
-        """Get emergency contacts for company (same as headquarters)"""
-        return cls.get_emergency_contacts_by_headquarters()
-
-    @classmethod
-    def get_emergency_contacts_by_entity(cls, entity_id):
-        """Get emergency contacts for specific entity"""
-        return cls.objects.filter(
-            employeelocation__location_type='entity',
-            employeelocation__location_id=entity_id,
-            employeelocation__show_in_emergency_contacts=True,
-            employeelocation__is_active=True,
-            is_active=True
-        ).distinct()
-
-    @classmethod
-    def get_emergency_contacts_by_site(cls, site_id):
-        """Get emergency contacts for specific site"""
-        return cls.objects.filter(
-            employeelocation__location_type='site',
-            employeelocation__location_id=site_id,
-            employeelocation__show_in_emergency_contacts=True,
-            employeelocation__is_active=True,
-            is_active=True
-        ).distinct()
+    def get_emergency_contacts(cls, **location_filters):
+        """
+        Get active employees shown in emergency contacts via an uncorrelated IN semi-join,
+        optionally narrowed to a location (location_type=..., location_id=...)
+        """
+        contact_locations = EmployeeLocation.objects.filter(
+            show_in_emergency_contacts=True,
+            is_active=True,
+            **location_filters
+        )
+        return cls.objects.filter(pk__in=contact_locations.values('employee_id'), is_active=True)
 
 class EmployeeLocation(models.Model):
     """EmployeeLocation model - represents employee deployment to locations"""
@@ -68,6 +57,7 @@ class EmployeeLocation(models.Model):
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE, related_name='locations')
     location_type = models.CharField(max_length=20, choices=LOCATION_TYPES)
     location_id = models.CharField(max_length=50)  # Can be 'headquarters', 'company', or actual ID
+    location_name = models.CharField(max_length=100, blank=True, editable=False)  # derived, filled on save
     show_in_emergency_contacts = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -76,19 +66,44 @@ class EmployeeLocation(models.Model):
     class Meta:
         verbose_name_plural = "Employee Locations"
         unique_together = ['employee', 'location_type', 'location_id']
+        indexes = [
+            # Emergency contact lookups always filter on both flags, so index only those rows
+            models.Index(
+                fields=['location_type', 'location_id', 'employee'],
+                condition=Q(show_in_emergency_contacts=True, is_active=True),
+                name='emp_loc_emergency_idx'
+            ),
+            models.Index(fields=['employee', 'is_active']),
+        ]
 
     def __str__(self):
         return f"{self.employee.name} - {self.location_type} ({self.location_id})"
 
-    @property
-    def location_name(self):
-        """Get the location name based on location_type and location_id"""
-        if self.location_type == 'headquarters':
+    def save(self, *args, **kwargs):
+        """Store the location's display name so reads never look it up"""
+        self.location_name = self.lookup_location_name(self.location_type, self.location_id)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def default_location_name(location_type, location_id):
+        """Placeholder name for a location without a stored real name"""
+        if location_type == 'headquarters':
             return 'Hexa Climate'
-        elif self.location_type == 'company':
+        elif location_type == 'company':
             return 'Hexa Climate'
-        elif self.location_type == 'site':
-            return f'Site {self.location_id}'
-        elif self.location_type == 'entity':
-            return f'Entity {self.location_id}'
-        return 'Unknown Location' 
\ No newline at end of file
+        elif location_type == 'site':
+            return f'Site {location_id}'
+        elif location_type == 'entity':
+            return f'Entity {location_id}'
+        return 'Unknown Location'
+
+    @classmethod
+    def lookup_location_name(cls, location_type, location_id):
+        """Real entity/site name for a location, or the placeholder if it doesn't exist"""
+        # Site/Entity renames and deletes keep stored names in step (see signals.py)
+        model = {'entity': Entity, 'site': Site}.get(location_type)
+        if model is not None and str(location_id).isdigit():
+            name = model.objects.filter(id=int(location_id)).values_list('name', flat=True).first()
+            if name is not None:
+                return name
+        return cls.default_location_name(location_type, location_id)
@@ -2,7 +2,7 @@ from rest_framework import serializers
 from .models import Employee, EmployeeLocation
 
 class EmployeeLocationSerializer(serializers.ModelSerializer):
-    location_name = serializers.SerializerMethodField()
+    location_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = EmployeeLocation
@@ -12,18 +12,6 @@ class EmployeeLocationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def get_location_name(self, obj):
-        """Get the location name based on location_type and location_id"""
-        if obj.location_type == 'headquarters':
-            return 'Hexa Climate'
-        elif obj.location_type == 'company':
-            return 'Hexa Climate'
-        elif obj.location_type == 'site':
-            return f'Site {obj.location_id}'
-        elif obj.location_type == 'entity':
-            return f'Entity {obj.location_id}'
-        return 'Unknown Location'
-
     def validate(self, data):
         """Validate location assignment"""
         location_type = data.get('location_type')
@@ -68,13 +56,3 @@ class EmployeeListSerializer(serializers.ModelSerializer):
             'designation', 'department', 'is_active',
             'locations', 'created_at', 'updated_at'
         ]
-
-class EmergencyContactSerializer(serializers.ModelSerializer):
-    locations = EmployeeLocationSerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Employee
-        fields = [
-            'id', 'employee_id', 'name', 'email', 'phone',
-            'designation', 'department', 'locations'
-        ] 
\ No newline at end of file
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.companies.models import Entity
+from apps.sites.models import Site
+from .models import EmployeeLocation
+
+LOCATION_TYPES_BY_MODEL = {Entity: 'entity', Site: 'site'}
+
+@receiver(post_save, sender=Entity)
+@receiver(post_save, sender=Site)
+def update_location_names(sender, instance, **kwargs):
+    """Copy an entity/site's current name onto the employee locations pointing at it"""
+    EmployeeLocation.objects.filter(
+        location_type=LOCATION_TYPES_BY_MODEL[sender],
+        location_id=str(instance.pk)
+    ).exclude(location_name=instance.name).update(location_name=instance.name)
+
+@receiver(post_delete, sender=Entity)
+@receiver(post_delete, sender=Site)
+def reset_location_names(sender, instance, **kwargs):
+    """Fall back to the placeholder name once the entity/site is gone"""
+    location_type = LOCATION_TYPES_BY_MODEL[sender]
+    EmployeeLocation.objects.filter(
+        location_type=location_type,
+        location_id=str(instance.pk)
+    ).update(location_name=EmployeeLocation.default_location_name(location_type, instance.pk))
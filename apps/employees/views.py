@@ -2,24 +2,71 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.filters import QueryParamFilterBackend
 from rest_framework import filters
+from django.db.models import Prefetch
+from django.utils import timezone
+from apps.common.stats import compute_stats
 from .models import Employee, EmployeeLocation
 from .serializers import (
-    EmployeeSerializer, EmployeeListSerializer, EmployeeLocationSerializer,
-    EmergencyContactSerializer
+    EmployeeSerializer, EmployeeListSerializer, EmployeeLocationSerializer
 )
 
+EMERGENCY_CONTACT_FIELDS = [
+    'id', 'employee_id', 'name', 'email', 'phone', 'designation', 'department'
+]
+EMERGENCY_CONTACT_LOCATION_FIELDS = [
+    'id', 'location_type', 'location_id', 'location_name',
+    'show_in_emergency_contacts', 'is_active', 'created_at', 'updated_at'
+]
+
+def serialize_emergency_contacts(employees):
+    """Build emergency contact payloads from two values() queries, bypassing ModelSerializer"""
+    contacts = list(employees.values(*EMERGENCY_CONTACT_FIELDS))
+    contacts_by_pk = {}
+    for contact in contacts:
+        contact['locations'] = []
+        contacts_by_pk[contact['id']] = contact
+    if not contacts_by_pk:
+        return contacts
+
+    locations = EmployeeLocation.objects.filter(
+        employee_id__in=list(contacts_by_pk), is_active=True
+    ).order_by('id').values('employee', *EMERGENCY_CONTACT_LOCATION_FIELDS)
+    for location in locations:
+        contacts_by_pk[location.pop('employee')]['locations'].append({
+            'id': location['id'],
+            'location_type': location['location_type'],
+            'location_id': location['location_id'],
+            'location_name': location['location_name'],
+            'show_in_emergency_contacts': location['show_in_emergency_contacts'],
+            'is_active': location['is_active'],
+            'created_at': timezone.localtime(location['created_at']),
+            'updated_at': timezone.localtime(location['updated_at']),
+        })
+    return contacts
+
 class EmployeeViewSet(viewsets.ModelViewSet):
     """ViewSet for managing employees"""
-    queryset = Employee.objects.prefetch_related('locations').all()
+    queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active', 'department']
     search_fields = ['name', 'employee_id', 'email', 'phone']
     ordering_fields = ['name', 'created_at', 'employee_id']
     ordering = ['-created_at']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ['list', 'retrieve']:
+            # Prefetch runs after pagination slices the queryset, so only the
+            # page's employees load locations. Updates drop the prefetch cache
+            # anyway and deletes never render locations, so skip it there.
+            queryset = queryset.prefetch_related(
+                Prefetch('locations', queryset=EmployeeLocation.objects.filter(is_active=True))
+            )
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return EmployeeListSerializer
@@ -30,23 +77,18 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for employees"""
-        total_employees = Employee.objects.filter(is_active=True).count()
-        emergency_contacts = Employee.objects.filter(
-            locations__show_in_emergency_contacts=True,
-            locations__is_active=True,
-            is_active=True
-        ).distinct().count()
+        employee_counts = compute_stats('employees')
         
         return Response({
-            'total_employees': total_employees,
-            'emergency_contacts': emergency_contacts,
+            'total_employees': employee_counts['total'],
+            'emergency_contacts': employee_counts['emergency_contacts'],
         })
 
 class EmployeeLocationViewSet(viewsets.ModelViewSet):
     """ViewSet for managing employee locations"""
     queryset = EmployeeLocation.objects.select_related('employee').all()
     serializer_class = EmployeeLocationSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['location_type', 'show_in_emergency_contacts', 'is_active']
     search_fields = ['employee__name', 'location_id']
     ordering_fields = ['created_at']
@@ -58,45 +100,37 @@ class EmployeeLocationViewSet(viewsets.ModelViewSet):
         location_type = request.query_params.get('location_type')
         location_id = request.query_params.get('location_id')
         
-        queryset = Employee.objects.filter(
-            locations__show_in_emergency_contacts=True,
-            locations__is_active=True,
-            is_active=True
-        ).distinct()
-        
+        location_filters = {}
         if location_type:
-            queryset = queryset.filter(locations__location_type=location_type)
+            location_filters['location_type'] = location_type
         
         if location_id:
-            queryset = queryset.filter(locations__location_id=location_id)
+            location_filters['location_id'] = location_id
+
+        queryset = Employee.get_emergency_contacts(**location_filters)
         
-        serializer = EmergencyContactSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(serialize_emergency_contacts(queryset))
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts/headquarters')
     def headquarters_emergency_contacts(self, request):
         """Get emergency contacts for headquarters"""
-        employees = Employee.get_emergency_contacts_by_headquarters()
-        serializer = EmergencyContactSerializer(employees, many=True)
-        return Response(serializer.data)
+        employees = Employee.get_emergency_contacts(location_type='headquarters')
+        return Response(serialize_emergency_contacts(employees))
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts/company')
     def company_emergency_contacts(self, request):
-        """Get emergency contacts for company"""
-        employees = Employee.get_emergency_contacts_by_company()
-        serializer = EmergencyContactSerializer(employees, many=True)
-        return Response(serializer.data)
+        """Get emergency contacts for company (same as headquarters)"""
+        employees = Employee.get_emergency_contacts(location_type='headquarters')
+        return Response(serialize_emergency_contacts(employees))
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts/entity/(?P<entity_id>[^/.]+)')
     def entity_emergency_contacts(self, request, entity_id=None):
         """Get emergency contacts for specific entity"""
-        employees = Employee.get_emergency_contacts_by_entity(entity_id)
-        serializer = EmergencyContactSerializer(employees, many=True)
-        return Response(serializer.data)
+        employees = Employee.get_emergency_contacts(location_type='entity', location_id=entity_id)
+        return Response(serialize_emergency_contacts(employees))
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts/site/(?P<site_id>[^/.]+)')
     def site_emergency_contacts(self, request, site_id=None):
         """Get emergency contacts for specific site"""
-        employees = Employee.get_emergency_contacts_by_site(site_id)
-        serializer = EmergencyContactSerializer(employees, many=True)
-        return Response(serializer.data) 
\ No newline at end of file
+        employees = Employee.get_emergency_contacts(location_type='site', location_id=site_id)
+        return Response(serialize_emergency_contacts(employees))
\ No newline at end of file
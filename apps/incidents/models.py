@@ -39,6 +39,10 @@ class Incident(models.Model):
     class Meta:
         verbose_name_plural = "Incidents"
         ordering = ['-reported_date']
+        indexes = [
+            models.Index(fields=['is_active', 'status']),
+            models.Index(fields=['is_active', 'severity']),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.severity}"
@@ -2,17 +2,14 @@ from rest_framework import serializers
 from .models import Incident
 
 class IncidentSerializer(serializers.ModelSerializer):
-    location_name = serializers.SerializerMethodField()
+    location_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = Incident
         fields = '__all__'
 
-    def get_location_name(self, obj):
-        return obj.location_name
-
 class IncidentListSerializer(serializers.ModelSerializer):
-    location_name = serializers.SerializerMethodField()
+    location_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = Incident
@@ -21,6 +18,3 @@ class IncidentListSerializer(serializers.ModelSerializer):
             'location_name', 'reporter_name', 'incident_date', 'reported_date',
             'is_active', 'created_at', 'updated_at'
         ]
-
-    def get_location_name(self, obj):
-        return obj.location_name 
\ No newline at end of file
@@ -1,8 +1,9 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.filters import QueryParamFilterBackend
 from rest_framework import filters
+from apps.common.stats import compute_stats
 from .models import Incident
 from .serializers import IncidentSerializer, IncidentListSerializer
 
@@ -10,12 +11,23 @@ class IncidentViewSet(viewsets.ModelViewSet):
     """ViewSet for managing incidents"""
     queryset = Incident.objects.all()
     serializer_class = IncidentSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['severity', 'status', 'location_type', 'is_active']
     search_fields = ['title', 'description', 'reporter_name']
     ordering_fields = ['incident_date', 'reported_date', 'severity', 'status']
     ordering = ['-reported_date']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Only load the columns IncidentListSerializer renders
+            queryset = queryset.only(
+                'id', 'title', 'severity', 'status', 'location_type', 'location_id',
+                'reporter_name', 'incident_date', 'reported_date',
+                'is_active', 'created_at', 'updated_at'
+            )
+        return queryset
+
     def get_serializer_class(self):
         if self.action == 'list':
             return IncidentListSerializer
@@ -26,16 +38,10 @@ class IncidentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for incidents"""
-        total_incidents = Incident.objects.filter(is_active=True).count()
-        open_incidents = Incident.objects.filter(
-            is_active=True, status='OPEN'
-        ).count()
-        critical_incidents = Incident.objects.filter(
-            is_active=True, severity='CRITICAL'
-        ).count()
+        incident_counts = compute_stats('incidents')
         
         return Response({
-            'total_incidents': total_incidents,
-            'open_incidents': open_incidents,
-            'critical_incidents': critical_incidents,
+            'total_incidents': incident_counts['total'],
+            'open_incidents': incident_counts['open'],
+            'critical_incidents': incident_counts['critical'],
         }) 
\ No newline at end of file
@@ -1,8 +1,17 @@
 from django.db import models
 from django.conf import settings
-import qrcode
-import base64
-from io import BytesIO
+from django.core.cache import cache
+from django.utils.functional import cached_property
+import segno
+
+def render_qr_data_uri(url):
+    """Render a URL as a QR code base64 PNG data URI"""
+    qr = segno.make(url, error='m')
+    return qr.png_data_uri(scale=10, border=5, dark='black', light='white')
+
+def qr_cache_key(url):
+    """Cache key for a rendered QR code; the image depends only on the encoded URL"""
+    return f"site_qr:{url}"
 
 class Site(models.Model):
     """Site model - represents specific locations under entities"""
@@ -42,6 +51,10 @@ class Site(models.Model):
 
     class Meta:
         verbose_name_plural = "Sites"
+        indexes = [
+            models.Index(fields=['is_active', 'operational_status']),
+            models.Index(fields=['is_active', 'plant_type']),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.site_code})"
@@ -50,25 +63,38 @@ class Site(models.Model):
         """Check if site is operational"""
         return self.operational_status == 'OPERATIONAL'
 
+    @staticmethod
+    def build_public_url(company_code, site_code):
+        return f"{settings.PUBLIC_QR_BASE}/{company_code}/{site_code}"
+
+    @cached_property
+    def public_url(self):
+        return self.build_public_url(self.entity.company.company_code, self.site_code)
+
+    @cached_property
+    def qr_code(self):
+        """Base64 PNG data URI of the public URL QR code"""
+        # A changed site code, company code or PUBLIC_QR_BASE maps to a fresh entry
+        return cache.get_or_set(
+            qr_cache_key(self.public_url),
+            self.render_qr_code,
+            timeout=None
+        )
+
+    def render_qr_code(self):
+        """Render the public URL QR code as a base64 PNG data URI"""
+        return render_qr_data_uri(self.public_url)
+
     def generate_qr_data(self):
         """Generate QR code data for site"""
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(f"http://localhost:3000/public/{self.entity.company.company_code}/{self.site_code}")
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
-        
         return {
-            'qr_code': f'data:image/png;base64,{img_str}',
+            'qr_code': self.qr_code,
             'site_data': {
                 'name': self.name,
                 'site_code': self.site_code,
                 'entity_name': self.entity.name,
                 'company_name': self.entity.company.name,
                 'company_code': self.entity.company.company_code,
-                'public_url': f"http://localhost:3000/public/{self.entity.company.company_code}/{self.site_code}"
+                'public_url': self.public_url
             }
-        } 
\ No newline at end of file
+        }
\ No newline at end of file
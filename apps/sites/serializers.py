@@ -10,21 +10,26 @@ class SiteSerializer(serializers.ModelSerializer):
         model = Site
         fields = '__all__'
 
-class SiteListSerializer(serializers.ModelSerializer):
-    entity_name = serializers.CharField(source='entity.name', read_only=True)
-    company_name = serializers.CharField(source='entity.company.name', read_only=True)
-    company_code = serializers.CharField(source='entity.company.company_code', read_only=True)
-
-    class Meta:
-        model = Site
-        fields = [
-            'id', 'name', 'site_code', 'entity_name', 'company_name', 'company_code',
-            'plant_type', 'operational_status', 'city', 'state', 'country', 'is_active',
-            'created_at', 'updated_at'
-        ]
+class SiteListSerializer(serializers.Serializer):
+    """Read-only list row, rendered from a Site.objects.values() projection"""
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    site_code = serializers.CharField()
+    entity_name = serializers.CharField()
+    company_name = serializers.CharField()
+    company_code = serializers.CharField()
+    plant_type = serializers.CharField()
+    operational_status = serializers.CharField()
+    city = serializers.CharField()
+    state = serializers.CharField()
+    country = serializers.CharField()
+    is_active = serializers.BooleanField()
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
 
 class SiteQRSerializer(serializers.ModelSerializer):
-    qr_code = serializers.SerializerMethodField()
+    qr_code = serializers.CharField(read_only=True)
+    public_url = serializers.CharField(read_only=True)
     entity_name = serializers.CharField(source='entity.name', read_only=True)
     company_name = serializers.CharField(source='entity.company.name', read_only=True)
     company_code = serializers.CharField(source='entity.company.company_code', read_only=True)
@@ -35,24 +40,3 @@ class SiteQRSerializer(serializers.ModelSerializer):
             'id', 'name', 'site_code', 'entity_name', 'company_name', 'company_code',
             'qr_code', 'public_url'
         ]
-
-    def get_qr_code(self, obj):
-        qr_data = obj.generate_qr_data()
-        return qr_data['qr_code']
-
-    @property
-    def public_url(self):
-        return f"http://localhost:3000/public/{self.entity.company.company_code}/{self.site_code}"
-
-class PublicSiteSerializer(serializers.ModelSerializer):
-    entity_name = serializers.CharField(source='entity.name', read_only=True)
-    company_name = serializers.CharField(source='entity.company.name', read_only=True)
-    company_code = serializers.CharField(source='entity.company.company_code', read_only=True)
-
-    class Meta:
-        model = Site
-        fields = [
-            'id', 'name', 'site_code', 'entity_name', 'company_name', 'company_code',
-            'plant_type', 'operational_status', 'address', 'city', 'state', 'country',
-            'phone', 'email', 'latitude', 'longitude'
-        ] 
\ No newline at end of file
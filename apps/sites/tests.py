@@ -0,0 +1,55 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from apps.companies.models import Company, Entity
+from .models import Site
+from .serializers import SiteListSerializer
+
+
+class SiteListTests(APITestCase):
+    """The site list renders values() rows through SiteListSerializer"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='sites')
+        company = Company.objects.create(company_code='HEXA001')
+        entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=company)
+        Site.objects.create(name='North', site_code='N1', entity=entity)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_list_rows_match_serializer_fields(self):
+        response = self.client.get('/api/v1/sites/')
+        row = response.data['results'][0]
+        self.assertEqual(set(row), set(SiteListSerializer().fields))
+        self.assertEqual(row['company_code'], 'HEXA001')
+        self.assertEqual(row['entity_name'], 'Plant')
+
+
+class SiteBulkQRTests(APITestCase):
+    """Batch QR rendering for the bulk-qr action"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='bulk')
+        company = Company.objects.create(company_code='HEXA001')
+        entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=company)
+        cls.site = Site.objects.create(name='North', site_code='N1', entity=entity)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+    def test_renders_known_sites_and_reports_missing(self):
+        response = self.client.post(
+            '/api/v1/sites/bulk-qr/', {'site_ids': [self.site.pk, 999999]}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['qr_codes'], {self.site.pk: self.site.render_qr_code()})
+        self.assertEqual(response.data['not_found'], [999999])
+
+    def test_rejects_boolean_site_ids(self):
+        response = self.client.post('/api/v1/sites/bulk-qr/', {'site_ids': [True]}, format='json')
+        self.assertEqual(response.status_code, 400)
@@ -1,22 +1,51 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
-from django_filters.rest_framework import DjangoFilterBackend
+from apps.common.filters import QueryParamFilterBackend
 from rest_framework import filters
 from django.views.decorators.csrf import csrf_exempt
-from django.utils.decorators import method_decorator
 from django.http import JsonResponse
-from .models import Site
+from django.db.models import F
+from django.core.cache import cache
+from apps.common.stats import compute_stats
+from .models import Site, render_qr_data_uri, qr_cache_key
 from .serializers import (
-    SiteSerializer, SiteListSerializer, SiteQRSerializer, PublicSiteSerializer
+    SiteSerializer, SiteListSerializer, SiteQRSerializer
 )
 
+PUBLIC_SITE_FIELDS = [
+    'id', 'name', 'site_code', 'entity_name', 'company_name', 'company_code',
+    'plant_type', 'operational_status', 'address', 'city', 'state', 'country',
+    'phone', 'email', 'latitude', 'longitude'
+]
+PUBLIC_SITE_RELATED_FIELDS = {
+    'entity_name': F('entity__name'),
+    'company_name': F('entity__company__name'),
+    'company_code': F('entity__company__company_code'),
+}
+
+# Upper bound on site ids per bulk QR request
+BULK_QR_MAX_SITES = 500
+
+def get_public_site_values(company_code, site_code):
+    """Fetch an active site's public fields as a plain dict, skipping model instantiation"""
+    row = Site.objects.filter(
+        entity__company__company_code=company_code,
+        site_code=site_code,
+        is_active=True
+    ).values(
+        *[field for field in PUBLIC_SITE_FIELDS if field not in PUBLIC_SITE_RELATED_FIELDS],
+        **PUBLIC_SITE_RELATED_FIELDS
+    ).first()
+    if row is None:
+        return None
+    return {field: row[field] for field in PUBLIC_SITE_FIELDS}
+
 class SiteViewSet(viewsets.ModelViewSet):
     """ViewSet for managing sites"""
     queryset = Site.objects.select_related('entity__company').all()
     serializer_class = SiteSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [QueryParamFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = [
         'entity', 'operational_status', 'is_active',
         'plant_type', 'state', 'country'
@@ -25,6 +54,24 @@ class SiteViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'created_at', 'site_code', 'operational_status']
     ordering = ['-created_at']
 
+    def list(self, request, *args, **kwargs):
+        """List sites from a values() projection instead of model instances"""
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            'id', 'name', 'site_code', 'plant_type', 'operational_status',
+            'city', 'state', 'country', 'is_active', 'created_at', 'updated_at',
+            entity_name=F('entity__name'),
+            company_name=F('entity__company__name'),
+            company_code=F('entity__company__company_code')
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
     def get_serializer_class(self):
         if self.action == 'list':
             return SiteListSerializer
@@ -52,91 +99,73 @@ class SiteViewSet(viewsets.ModelViewSet):
             'company_code': site.entity.company.company_code,
             'qr_code': qr_data['qr_code'],
             'site_data': qr_data['site_data'],
-            'public_url': f"http://localhost:3000/public/{site.entity.company.company_code}/{site.site_code}"
+            'public_url': site.public_url
+        })
+
+    @action(detail=False, methods=['post'], url_path='bulk-qr')
+    def bulk_qr(self, request):
+        """Generate QR codes for a batch of sites, keyed by site id"""
+        site_ids = request.data.get('site_ids')
+        if (not isinstance(site_ids, list) or len(site_ids) > BULK_QR_MAX_SITES
+                or not all(isinstance(site_id, int) and not isinstance(site_id, bool) for site_id in site_ids)):
+            return Response({
+                'error': f'site_ids must be a list of at most {BULK_QR_MAX_SITES} integer site ids'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = Site.objects.filter(id__in=site_ids).values_list(
+            'id', 'entity__company__company_code', 'site_code'
+        )
+        urls = {
+            site_id: Site.build_public_url(company_code, site_code)
+            for site_id, company_code, site_code in rows
+        }
+
+        # Shares cache entries with Site.qr_code, so warm sites cost one lookup
+        cached = cache.get_many([qr_cache_key(url) for url in urls.values()])
+        qr_codes, missing = {}, {}
+        for site_id, url in urls.items():
+            if qr_cache_key(url) in cached:
+                qr_codes[site_id] = cached[qr_cache_key(url)]
+            else:
+                missing[site_id] = url
+
+        if missing:
+            rendered = {site_id: render_qr_data_uri(url) for site_id, url in missing.items()}
+            cache.set_many(
+                {qr_cache_key(missing[site_id]): qr_code for site_id, qr_code in rendered.items()},
+                timeout=None
+            )
+            qr_codes.update(rendered)
+
+        return Response({
+            'qr_codes': {site_id: qr_codes[site_id] for site_id in sorted(qr_codes)},
+            'not_found': [site_id for site_id in site_ids if site_id not in urls]
         })
 
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for sites"""
-        total_sites = Site.objects.filter(is_active=True).count()
-        operational_sites = Site.objects.filter(
-            is_active=True, operational_status='OPERATIONAL'
-        ).count()
-        maintenance_sites = Site.objects.filter(
-            is_active=True, operational_status='MAINTENANCE'
-        ).count()
+        site_counts = compute_stats('sites')
         
         return Response({
-            'total_sites': total_sites,
-            'operational_sites': operational_sites,
-            'maintenance_sites': maintenance_sites,
+            'total_sites': site_counts['total'],
+            'operational_sites': site_counts['operational'],
+            'maintenance_sites': site_counts['maintenance'],
         })
 
-@method_decorator(csrf_exempt, name='dispatch')
-class PublicSiteAccessView(viewsets.ReadOnlyModelViewSet):
-    """Public access view for QR code scanning"""
-    serializer_class = PublicSiteSerializer
-    permission_classes = [AllowAny]
-
-    def get_queryset(self):
-        return Site.objects.select_related('entity__company').filter(is_active=True)
-
-    @action(detail=False, methods=['get'], url_path='public/(?P<company_code>[^/.]+)/(?P<site_code>[^/.]+)')
-    def get_by_codes(self, request, company_code=None, site_code=None):
-        """Get site by company code and site code"""
-        try:
-            site = Site.objects.filter(
-                entity__company__company_code=company_code,
-                site_code=site_code,
-                is_active=True
-            ).select_related('entity__company').first()
-            
-            if not site:
-                return Response({
-                    'error': 'Site not found'
-                }, status=status.HTTP_404_NOT_FOUND)
-            
-            serializer = PublicSiteSerializer(site)
-            return Response(serializer.data)
-            
-        except Exception as e:
-            return Response({
-                'error': 'An error occurred while fetching site data'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
 @csrf_exempt
 def validate_site_qr(request, company_code, site_code):
     """Validate site QR code and return site data"""
     try:
-        site = Site.objects.filter(
-            entity__company__company_code=company_code,
-            site_code=site_code,
-            is_active=True
-        ).select_related('entity__company').first()
+        site_data = get_public_site_values(company_code, site_code)
         
-        if not site:
+        if not site_data:
             return JsonResponse({
                 'error': 'Site not found'
             }, status=404)
         
-        site_data = {
-            'id': site.id,
-            'name': site.name,
-            'site_code': site.site_code,
-            'entity_name': site.entity.name,
-            'company_name': site.entity.company.name,
-            'company_code': site.entity.company.company_code,
-            'plant_type': site.plant_type,
-            'operational_status': site.operational_status,
-            'address': site.address,
-            'city': site.city,
-            'state': site.state,
-            'country': site.country,
-            'phone': site.phone,
-            'email': site.email,
-            'latitude': float(site.latitude) if site.latitude else None,
-            'longitude': float(site.longitude) if site.longitude else None,
-        }
+        site_data['latitude'] = float(site_data['latitude']) if site_data['latitude'] else None
+        site_data['longitude'] = float(site_data['longitude']) if site_data['longitude'] else None
         
         return JsonResponse({
             'success': True,
@@ -91,6 +91,28 @@ DATABASES = {
 }
 
 
+# Cache
+# Dashboard payloads are invalidated from model signals, which only reaches
+# every worker through a shared backend. Set REDIS_URL for any multi-process
+# deployment; without it each process keeps its own LocMemCache and other
+# workers see writes only once their entries expire (DASHBOARD_CACHE_TIMEOUT).
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -161,4 +183,7 @@ CORS_ALLOW_CREDENTIALS = True
 # Company settings - Single company approach
 COMPANY_NAME = 'Hexa Climate'
 COMPANY_CODE = 'HEXA001'
-HEADQUARTERS_NAME = 'Hexa Climate Headquarters' 
\ No newline at end of file
+HEADQUARTERS_NAME = 'Hexa Climate Headquarters'
+
+# Base URL of the public frontend pages that QR codes point to
+PUBLIC_QR_BASE = 'http://localhost:3000/public'
\ No newline at end of file
@@ -0,0 +1 @@
+# Apps package
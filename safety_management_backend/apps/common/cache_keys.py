@@ -0,0 +1,10 @@
+# Cached dashboard stats shared by the views and the invalidation signals. Kept
+# apart from views.py so registering the receivers doesn't import the views.
+
+# Dashboards poll frequently; serve cached stats for a short window.
+# Writes invalidate the keys early (see each app's signals.py).
+DASHBOARD_CACHE_TIMEOUT = 30
+
+COMPANY_DASHBOARD_CACHE_KEY = 'companies:dashboard-stats:v1'
+SITE_DASHBOARD_CACHE_KEY = 'sites:dashboard-stats:v1'
+EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY = 'emergency-contacts:dashboard-stats:v1'
@@ -0,0 +1,60 @@
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import QuerySet, Case, When, Value
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap and the planner estimate is
+# too coarse to be useful, so approx_count falls back to counting.
+APPROX_COUNT_THRESHOLD = 10000
+
+def approx_count(model):
+    """Return the total row count for model, using the Postgres planner estimate for large tables"""
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(model._meta.db_table)]
+            )
+            row = cursor.fetchone()
+        if row and row[0] >= APPROX_COUNT_THRESHOLD:
+            return row[0]
+    return model.objects.count()
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that takes unfiltered table totals from approx_count instead of COUNT(*)"""
+
+    @cached_property
+    def count(self):
+        object_list = self.object_list
+        if isinstance(object_list, QuerySet) and not object_list.query.where:
+            return approx_count(object_list.model)
+        return super().count
+
+def toggle_flag(queryset, pk, field, current=None):
+    """
+    Flip a boolean column on one row of queryset with a single narrow UPDATE.
+    Returns the new value, or None if no row matched pk. Pass current when the
+    row is already loaded: the UPDATE then writes its negation and the value is
+    returned without reading the row back. update() skips post_save, so callers
+    must invalidate any caches themselves.
+    """
+    if current is None:
+        value = Case(When(**{field: True}, then=Value(False)), default=Value(True))
+    else:
+        value = not current
+    changes = {field: value}
+    # update() bypasses auto_now, so stamp updated_at on models that have one
+    if any(f.name == 'updated_at' for f in queryset.model._meta.concrete_fields):
+        changes['updated_at'] = timezone.now()
+    try:
+        queryset = queryset.filter(pk=pk)
+        updated = queryset.update(**changes)
+    except (TypeError, ValueError):
+        # Malformed pk in the filter
+        return None
+    if not updated:
+        return None
+    if current is not None:
+        return value
+    return queryset.values_list(field, flat=True).get()
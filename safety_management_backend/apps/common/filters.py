@@ -0,0 +1,22 @@
+import django_filters
+
+from .models import EmergencyContact
+
+
+class EmergencyContactFilter(django_filters.FilterSet):
+    """
+    Filters for emergency contacts, including the legacy
+    active_only/primary_only flags used by the frontend
+    """
+    active_only = django_filters.BooleanFilter(method='filter_only', field_name='is_active')
+    primary_only = django_filters.BooleanFilter(method='filter_only', field_name='is_primary')
+
+    class Meta:
+        model = EmergencyContact
+        fields = ['company', 'site', 'contact_type', 'is_active', 'is_primary']
+
+    def filter_only(self, queryset, name, value):
+        """Restrict to rows where the flag is set; a false value leaves the queryset as is"""
+        if value:
+            return queryset.filter(**{name: True})
+        return queryset
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='emergencycontact',
+            constraint=models.CheckConstraint(check=models.Q(('contact_type__in', ['SITE_MANAGER', 'SAFETY_OFFICER', 'EMERGENCY_RESPONSE', 'GENERAL'])), name='emergency_contact_type_valid'),
+        ),
+    ]
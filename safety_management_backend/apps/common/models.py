@@ -44,6 +44,12 @@ class EmergencyContact(models.Model):
         ordering = ['-is_primary', 'name']
         verbose_name = "Emergency Contact"
         verbose_name_plural = "Emergency Contacts"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(contact_type__in=['SITE_MANAGER', 'SAFETY_OFFICER', 'EMERGENCY_RESPONSE', 'GENERAL']),
+                name='emergency_contact_type_valid',
+            ),
+        ]
     
     def __str__(self):
         site_name = f" - {self.site.name}" if self.site else ""
@@ -0,0 +1,17 @@
+from rest_framework.response import Response
+
+class PaginatedActionMixin:
+    """ViewSet mixin so custom list actions page the same way as the list endpoint"""
+
+    def paginated_response(self, queryset, serializer_class=None):
+        """Serialize one page of queryset, or all of it if pagination is disabled"""
+        serializer_class = serializer_class or self.get_serializer_class()
+        context = self.get_serializer_context()
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = serializer_class(queryset, many=True, context=context)
+        return Response(serializer.data)
@@ -4,13 +4,18 @@ from apps.companies.serializers import CompanySerializer
 from apps.sites.serializers import SiteSerializer
 
 class EmergencyContactSerializer(serializers.ModelSerializer):
-    """Full serializer for EmergencyContact model"""
-    company = CompanySerializer(read_only=True)
-    site = SiteSerializer(read_only=True)
+    """Full serializer for EmergencyContact model, with company and site as flat PK + name fields"""
+    company_name = serializers.CharField(source='company.name', read_only=True)
+    site_name = serializers.CharField(source='site.name', read_only=True)
     
     class Meta:
         model = EmergencyContact
-        fields = '__all__'
+        fields = [
+            'id', 'company', 'company_name', 'site', 'site_name',
+            'name', 'position', 'contact_type', 'phone', 'email',
+            'alternate_phone', 'is_available_24_7', 'availability_notes',
+            'is_active', 'is_primary', 'created_at', 'updated_at'
+        ]
         read_only_fields = ('created_at', 'updated_at')
     
     def to_representation(self, instance):
@@ -20,6 +25,11 @@ class EmergencyContactSerializer(serializers.ModelSerializer):
         data['primary_contact'] = instance.primary_contact
         return data
 
+class EmergencyContactDetailSerializer(EmergencyContactSerializer):
+    """Detail serializer for EmergencyContact model with nested company and site"""
+    company = CompanySerializer(read_only=True)
+    site = SiteSerializer(read_only=True)
+
 class EmergencyContactListSerializer(serializers.ModelSerializer):
     """Simplified serializer for emergency contact lists"""
     company_name = serializers.CharField(source='company.name', read_only=True)
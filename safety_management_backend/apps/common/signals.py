@@ -0,0 +1,10 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import EmergencyContact
+from .cache_keys import EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY
+
+@receiver([post_save, post_delete], sender=EmergencyContact)
+def invalidate_emergency_contact_dashboard_stats(sender, **kwargs):
+    """Drop the cached emergency contact dashboard stats whenever a contact changes"""
+    cache.delete(EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY)
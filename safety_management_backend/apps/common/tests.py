@@ -1,3 +1,98 @@
+from unittest import mock
+from django.contrib.auth.models import User
 from django.test import TestCase
+from rest_framework.test import APITestCase
+from apps.companies.models import Company
+from .db import EstimatedCountPaginator, approx_count, toggle_flag
+from .models import EmergencyContact
+from .views import EmergencyContactViewSet
 
-# Create your tests here.
+
+class ApproxCountTests(TestCase):
+    """Row counts outside Postgres, or below the estimate threshold, are exact"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for code in ('A', 'B', 'C'):
+            Company.objects.create(name=f'Company {code}', company_code=code, city='Pune')
+
+    def test_fallback_counts_rows(self):
+        self.assertEqual(approx_count(Company), 3)
+
+    def test_unfiltered_paginator_uses_approx_count(self):
+        paginator = EstimatedCountPaginator(Company.objects.all(), 2)
+        self.assertEqual(paginator.count, 3)
+        self.assertEqual(paginator.num_pages, 2)
+
+    def test_filtered_paginator_counts_the_filter(self):
+        paginator = EstimatedCountPaginator(Company.objects.filter(company_code='A'), 2)
+        self.assertEqual(paginator.count, 1)
+
+    def test_paginator_accepts_lists(self):
+        self.assertEqual(EstimatedCountPaginator([1, 2, 3, 4], 2).count, 4)
+
+
+class EmergencyContactToggleTests(APITestCase):
+    """toggle-status / toggle-primary go through get_object()"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='contacts')
+        company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.contact = EmergencyContact.objects.create(company=company, name='Fire desk', position='Warden')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_toggle_flips_the_flag(self):
+        response = self.client.post(f'/api/v1/emergency-contacts/{self.contact.pk}/toggle-primary/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.data['is_primary'], True)
+        self.contact.refresh_from_db()
+        self.assertTrue(self.contact.is_primary)
+
+    def test_toggle_is_a_select_and_an_update(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(f'/api/v1/emergency-contacts/{self.contact.pk}/toggle-status/')
+        self.assertIs(response.data['is_active'], False)
+        self.assertEqual(response.data['id'], self.contact.pk)
+
+    def test_toggle_checks_object_permissions(self):
+        with mock.patch.object(EmergencyContactViewSet, 'check_object_permissions') as check:
+            self.client.post(f'/api/v1/emergency-contacts/{self.contact.pk}/toggle-status/')
+        check.assert_called_once()
+        self.assertEqual(check.call_args.args[1], self.contact)
+
+    def test_toggle_unknown_or_malformed_pk_is_404(self):
+        for pk in (self.contact.pk + 1, 'abc'):
+            response = self.client.post(f'/api/v1/emergency-contacts/{pk}/toggle-status/')
+            self.assertEqual(response.status_code, 404)
+
+    def test_toggle_requires_authentication(self):
+        self.client.force_authenticate(None)
+        response = self.client.post(f'/api/v1/emergency-contacts/{self.contact.pk}/toggle-status/')
+        self.assertEqual(response.status_code, 403)
+        self.contact.refresh_from_db()
+        self.assertTrue(self.contact.is_active)
+
+
+class ToggleFlagTests(TestCase):
+    """toggle_flag with and without a known prior value"""
+
+    @classmethod
+    def setUpTestData(cls):
+        company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.contact = EmergencyContact.objects.create(company=company, name='Fire desk', position='Warden')
+
+    def test_reads_back_the_new_value(self):
+        with self.assertNumQueries(2):
+            self.assertIs(toggle_flag(EmergencyContact.objects.all(), self.contact.pk, 'is_primary'), True)
+
+    def test_known_prior_value_skips_the_read_back(self):
+        with self.assertNumQueries(1):
+            self.assertIs(toggle_flag(EmergencyContact.objects.all(), self.contact.pk, 'is_primary', current=False), True)
+        self.contact.refresh_from_db()
+        self.assertTrue(self.contact.is_primary)
+
+    def test_missing_row_is_none(self):
+        self.assertIsNone(toggle_flag(EmergencyContact.objects.all(), self.contact.pk + 1, 'is_primary', current=False))
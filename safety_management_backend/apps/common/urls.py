@@ -1,10 +1,11 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import EmergencyContactViewSet
+from .views import EmergencyContactViewSet, qr_image
 
 router = DefaultRouter()
 router.register(r'emergency-contacts', EmergencyContactViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('qr/', qr_image, name='qr-image'),
 ] 
\ No newline at end of file
@@ -1,27 +1,40 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from django.db.models import Q, Count
+from django.core.cache import cache
+from django.core import signing
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import require_GET
 
 from .models import EmergencyContact
+from .db import approx_count, toggle_flag
+from .filters import EmergencyContactFilter
+from .pagination import PaginatedActionMixin
 from .serializers import (
     EmergencyContactSerializer,
+    EmergencyContactDetailSerializer,
     EmergencyContactListSerializer,
     EmergencyContactCreateUpdateSerializer
 )
-from apps.companies.models import Company
+from apps.companies.models import (
+    Company, QR_CACHE_TIMEOUT, QR_DATA_MAX_LENGTH, cached_qr_png, unsign_qr_data
+)
 from apps.sites.models import Site
+from .cache_keys import DASHBOARD_CACHE_TIMEOUT, EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY
 
-class EmergencyContactViewSet(viewsets.ModelViewSet):
+class EmergencyContactViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing emergency contacts
     """
     queryset = EmergencyContact.objects.select_related('company', 'site').all()
     serializer_class = EmergencyContactSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['company', 'site', 'contact_type', 'is_active', 'is_primary']
+    filterset_class = EmergencyContactFilter
     search_fields = ['name', 'position', 'phone', 'email']
     ordering_fields = ['name', 'created_at', 'contact_type']
     ordering = ['-is_primary', 'name']
@@ -32,31 +45,25 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
             return EmergencyContactListSerializer
         elif self.action in ['create', 'update', 'partial_update']:
             return EmergencyContactCreateUpdateSerializer
+        elif self.action == 'retrieve':
+            return EmergencyContactDetailSerializer
         return EmergencyContactSerializer
 
     def get_queryset(self):
-        """Filter queryset based on query parameters"""
+        """Narrow joins and columns per action; query params go through EmergencyContactFilter"""
         queryset = super().get_queryset()
 
-        # Filter by company if provided
-        company_id = self.request.query_params.get('company')
-        if company_id:
-            queryset = queryset.filter(company_id=company_id)
-
-        # Filter by site if provided
-        site_id = self.request.query_params.get('site')
-        if site_id:
-            queryset = queryset.filter(site_id=site_id)
+        # The detail serializer nests SiteSerializer, which reads the site's
+        # company and configuration; both are to-one, so join them in too
+        if self.action == 'retrieve':
+            queryset = queryset.select_related('site__company', 'site__siteconfiguration')
 
-        # Filter by active contacts only if specified
-        active_only = self.request.query_params.get('active_only')
-        if active_only and active_only.lower() == 'true':
-            queryset = queryset.filter(is_active=True)
-
-        # Filter by primary contacts only
-        primary_only = self.request.query_params.get('primary_only')
-        if primary_only and primary_only.lower() == 'true':
-            queryset = queryset.filter(is_primary=True)
+        # Only load the columns EmergencyContactListSerializer renders
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'name', 'position', 'contact_type', 'phone', 'email',
+                'is_primary', 'is_active', 'company__name', 'site__name'
+            )
 
         return queryset
 
@@ -69,8 +76,7 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
                 company=company,
                 is_active=True
             )
-            serializer = self.get_serializer(contacts, many=True)
-            return Response(serializer.data)
+            return self.paginated_response(contacts)
         except Company.DoesNotExist:
             return Response(
                 {'error': 'Company not found'},
@@ -86,8 +92,7 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
                 site=site,
                 is_active=True
             )
-            serializer = self.get_serializer(contacts, many=True)
-            return Response(serializer.data)
+            return self.paginated_response(contacts)
         except Site.DoesNotExist:
             return Response(
                 {'error': 'Site not found'},
@@ -101,41 +106,57 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
             is_primary=True,
             is_active=True
         )
-        serializer = self.get_serializer(contacts, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(contacts)
 
     @action(detail=True, methods=['post'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
         """Toggle emergency contact active status"""
-        contact = self.get_object()
-        contact.is_active = not contact.is_active
-        contact.save()
+        contact, is_active = self._toggle_flag('is_active')
         
         return Response({
-            'id': contact.id,
-            'is_active': contact.is_active,
-            'message': f"Emergency contact {'activated' if contact.is_active else 'deactivated'} successfully"
+            'id': contact.pk,
+            'is_active': is_active,
+            'message': f"Emergency contact {'activated' if is_active else 'deactivated'} successfully"
         })
 
     @action(detail=True, methods=['post'], url_path='toggle-primary')
     def toggle_primary(self, request, pk=None):
         """Toggle primary contact status"""
-        contact = self.get_object()
-        contact.is_primary = not contact.is_primary
-        contact.save()
+        contact, is_primary = self._toggle_flag('is_primary')
         
         return Response({
-            'id': contact.id,
-            'is_primary': contact.is_primary,
-            'message': f"Emergency contact {'set as primary' if contact.is_primary else 'removed as primary'} successfully"
+            'id': contact.pk,
+            'is_primary': is_primary,
+            'message': f"Emergency contact {'set as primary' if is_primary else 'removed as primary'} successfully"
         })
 
+    def _toggle_flag(self, field):
+        """Flip a boolean column on the requested contact with a single narrow UPDATE; returns (contact, new value)"""
+        # get_object() applies the viewset's lookup, filtering and object permissions
+        contact = self.get_object()
+        value = toggle_flag(self.get_queryset(), contact.pk, field, current=getattr(contact, field))
+        if value is None:
+            raise NotFound()
+
+        # update() skips post_save, so drop the cached dashboard stats here
+        cache.delete(EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY)
+        return contact, value
+
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for emergency contacts"""
-        total_contacts = EmergencyContact.objects.count()
-        active_contacts = EmergencyContact.objects.filter(is_active=True).count()
-        primary_contacts = EmergencyContact.objects.filter(is_primary=True, is_active=True).count()
+        stats = cache.get_or_set(
+            EMERGENCY_CONTACT_DASHBOARD_CACHE_KEY, self._dashboard_stats, DASHBOARD_CACHE_TIMEOUT
+        )
+        return Response(stats)
+
+    def _dashboard_stats(self):
+        """Compute dashboard statistics for emergency contacts"""
+        total_contacts = approx_count(EmergencyContact)
+        counts = EmergencyContact.objects.aggregate(
+            active_contacts=Count('id', filter=Q(is_active=True)),
+            primary_contacts=Count('id', filter=Q(is_primary=True, is_active=True))
+        )
         
         # Contact type distribution
         type_distribution = EmergencyContact.objects.values('contact_type').annotate(
@@ -149,13 +170,13 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
         
         stats = {
             'total_contacts': total_contacts,
-            'active_contacts': active_contacts,
-            'primary_contacts': primary_contacts,
+            'active_contacts': counts['active_contacts'],
+            'primary_contacts': counts['primary_contacts'],
             'type_distribution': list(type_distribution),
             'company_distribution': list(company_distribution)
         }
         
-        return Response(stats)
+        return stats
 
     def perform_create(self, serializer):
         """Custom create logic"""
@@ -170,3 +191,17 @@ class EmergencyContactViewSet(viewsets.ModelViewSet):
     def perform_destroy(self, instance):
         """Custom delete logic"""
         instance.delete()
+
+@require_GET
+def qr_image(request):
+    """Serve the PNG QR code for a ?data= value signed by qr_image_url, cached after the first render"""
+    try:
+        data = unsign_qr_data(request.GET.get('data', ''))
+    except signing.BadSignature:
+        return HttpResponseBadRequest('data must be a signed QR payload')
+    if not data or len(data) > QR_DATA_MAX_LENGTH:
+        return HttpResponseBadRequest(f'data must be 1-{QR_DATA_MAX_LENGTH} characters')
+
+    response = HttpResponse(cached_qr_png(data), content_type='image/png')
+    patch_cache_control(response, public=True, max_age=QR_CACHE_TIMEOUT)
+    return response
@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Company
+from apps.common.db import EstimatedCountPaginator
 
 @admin.register(Company)
 class CompanyAdmin(admin.ModelAdmin):
@@ -8,6 +9,10 @@ class CompanyAdmin(admin.ModelAdmin):
     search_fields = ['name', 'company_code', 'city', 'state']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['name']
+    # Unfiltered pages use the planner estimate; skip the extra unfiltered
+    # count the changelist would otherwise run next to filtered results
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Basic Information', {
@@ -1,9 +1,45 @@
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from django.utils import timezone
-import qrcode
-import base64
+from django.core import signing
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.http import urlencode
+import hashlib
+import segno
 from io import BytesIO
 
+# QR images only depend on the encoded data, so they can live in the cache for a day
+QR_CACHE_TIMEOUT = 60 * 60 * 24
+# Longest payload the QR image endpoint will encode
+QR_DATA_MAX_LENGTH = 1024
+# QR image URLs carry their payload signed with this salt, so the endpoint only
+# renders data the API handed out
+QR_SIGNING_SALT = 'apps.companies.qr-image'
+
+def render_qr_png(data):
+    """Render data as PNG QR code bytes"""
+    qr = segno.make_qr(data, error='m')
+    with BytesIO() as buffer:
+        qr.save(buffer, kind='png', scale=10, border=5, dark='black', light='white')
+        return buffer.getvalue()
+
+def cached_qr_png(data):
+    """PNG QR code for data, rendered once and then served from the cache"""
+    key = f"qr-png:{hashlib.sha256(data.encode()).hexdigest()}"
+    return cache.get_or_set(key, lambda: render_qr_png(data), QR_CACHE_TIMEOUT)
+
+def qr_image_url(data, request=None):
+    """URL of the QR image endpoint that renders data; absolute when request is given"""
+    signed = signing.Signer(salt=QR_SIGNING_SALT).sign(data)
+    path = f"{reverse('qr-image')}?{urlencode({'data': signed})}"
+    return request.build_absolute_uri(path) if request is not None else path
+
+def unsign_qr_data(value):
+    """Recover the payload signed by qr_image_url; raises signing.BadSignature if tampered"""
+    return signing.Signer(salt=QR_SIGNING_SALT).unsign(value)
+
 class Company(models.Model):
     """
     Company model - serves as both company and headquarters
@@ -42,6 +78,14 @@ class Company(models.Model):
     class Meta:
         verbose_name_plural = "Companies"
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_active', 'company_type'], name='company_active_type_idx'),
+            models.Index(fields=['state', 'country'], name='company_state_country_idx'),
+            # Trigram indexes back the admin/API icontains searches (needs pg_trgm, see 0002).
+            # icontains compiles to UPPER(col) LIKE UPPER(%s), so the indexed expression is UPPER(col).
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='company_name_trgm'),
+            GinIndex(OpClass(Upper('city'), name='gin_trgm_ops'), name='company_city_trgm'),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.company_code})"
@@ -54,23 +98,16 @@ class Company(models.Model):
     def full_address(self):
         return f"{self.address}, {self.city}, {self.state} {self.postal_code}, {self.country}"
 
-    def generate_qr_data(self):
+    def generate_qr_data(self, request=None):
         """Generate QR code data for company"""
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(f"http://localhost:3000/public/{self.company_code}/headquarters")
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
+        public_url = f"http://localhost:3000/public/{self.company_code}/headquarters"
         
         return {
-            'qr_code': f'data:image/png;base64,{img_str}',
+            'qr_code_url': qr_image_url(public_url, request),
             'company_data': {
                 'name': self.name,
                 'company_code': self.company_code,
-                'public_url': f"http://localhost:3000/public/{self.company_code}/headquarters"
+                'public_url': public_url
             }
         }
 
@@ -109,24 +146,17 @@ class Entity(models.Model):
     def __str__(self):
         return f"{self.name} ({self.entity_code})"
 
-    def generate_qr_data(self):
+    def generate_qr_data(self, request=None):
         """Generate QR code data for entity"""
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
-        qr.add_data(f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}")
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        img_str = base64.b64encode(buffer.getvalue()).decode()
+        public_url = f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}"
         
         return {
-            'qr_code': f'data:image/png;base64,{img_str}',
+            'qr_code_url': qr_image_url(public_url, request),
             'entity_data': {
                 'name': self.name,
                 'entity_code': self.entity_code,
                 'company_name': self.company.name,
                 'company_code': self.company.company_code,
-                'public_url': f"http://localhost:3000/public/{self.company.company_code}/entity/{self.entity_code}"
+                'public_url': public_url
             }
         }
@@ -3,18 +3,13 @@ from .models import Company
 
 class CompanySerializer(serializers.ModelSerializer):
     """Serializer for Company model"""
+    is_headquarters = serializers.BooleanField(read_only=True)
+    full_address = serializers.CharField(read_only=True)
     
     class Meta:
         model = Company
         fields = '__all__'
         read_only_fields = ('created_at', 'updated_at')
-    
-    def to_representation(self, instance):
-        """Custom representation for API responses"""
-        data = super().to_representation(instance)
-        data['is_headquarters'] = instance.is_headquarters
-        data['full_address'] = instance.full_address
-        return data
 
 class CompanyListSerializer(serializers.ModelSerializer):
     """Simplified serializer for company lists"""
@@ -38,9 +33,3 @@ class CompanyCreateUpdateSerializer(serializers.ModelSerializer):
             'address', 'city', 'state', 'country', 'postal_code',
             'phone', 'email', 'latitude', 'longitude', 'is_active'
         ]
-    
-    def validate_company_code(self, value):
-        """Validate company code uniqueness"""
-        if Company.objects.filter(company_code=value).exists():
-            raise serializers.ValidationError("Company code must be unique.")
-        return value 
\ No newline at end of file
@@ -0,0 +1,10 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Company
+from apps.common.cache_keys import COMPANY_DASHBOARD_CACHE_KEY
+
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_company_dashboard_stats(sender, **kwargs):
+    """Drop the cached company dashboard stats whenever a company changes"""
+    cache.delete(COMPANY_DASHBOARD_CACHE_KEY)
@@ -1,3 +1,121 @@
-from django.test import TestCase
+from unittest import mock, skipUnless
+from urllib.parse import parse_qs, urlsplit
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from apps.sites.models import Site
+from .models import Company, Entity, QR_DATA_MAX_LENGTH, qr_image_url
+from .views import CompanyViewSet
 
-# Create your tests here.
+
+class QRImageTests(TestCase):
+    """The QR image endpoint only renders payloads signed by qr_image_url"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_signed_url_renders_png(self):
+        response = self.client.get(qr_image_url('http://localhost:3000/public/HEXA001/headquarters'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertTrue(response.content.startswith(b'\x89PNG'))
+
+    def test_unsigned_data_is_rejected(self):
+        response = self.client.get(reverse('qr-image'), {'data': 'http://example.com/'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_tampered_data_is_rejected(self):
+        signed = parse_qs(urlsplit(qr_image_url('HEXA001')).query)['data'][0]
+        tampered = signed.replace('HEXA001', 'HEXA002', 1)
+        response = self.client.get(reverse('qr-image'), {'data': tampered})
+        self.assertEqual(response.status_code, 400)
+
+    def test_length_limit(self):
+        self.assertEqual(self.client.get(qr_image_url('x' * QR_DATA_MAX_LENGTH)).status_code, 200)
+        self.assertEqual(self.client.get(qr_image_url('x' * (QR_DATA_MAX_LENGTH + 1))).status_code, 400)
+
+    def test_url_is_absolute_with_request(self):
+        request = RequestFactory().get('/')
+        self.assertTrue(qr_image_url('HEXA001', request).startswith('http://testserver/api/v1/qr/?data='))
+
+
+class QRCodeURLTests(APITestCase):
+    """QR payloads link to the image endpoint instead of embedding base64 PNGs"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='qr')
+        cls.company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.entity = Entity.objects.create(name='Plant', entity_code='ENT1', company=cls.company)
+        cls.site = Site.objects.create(name='North', site_code='N1', company=cls.company)
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_model_payloads_have_no_inline_images(self):
+        for payload in (self.company.generate_qr_data(), self.entity.generate_qr_data(),
+                        self.site.generate_qr_data(), self.site.generate_qr_data(qr_type='url')):
+            self.assertIn('qr_code_url', payload)
+            self.assertNotIn('qr_code', payload)
+            self.assertNotIn('qr_code_image', payload)
+
+    def test_site_qr_actions_return_absolute_image_urls(self):
+        for action in ('qr', 'qr-url'):
+            response = self.client.get(f'/api/v1/sites/{self.site.pk}/{action}/')
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('qr_code', response.data)
+            self.assertTrue(response.data['qr_code_url'].startswith('http://testserver/api/v1/qr/?data='))
+
+
+class CompanySearchIndexTests(TestCase):
+    """The trigram indexes cover the expression icontains searches on"""
+
+    def index_sql(self, name):
+        index = next(index for index in Company._meta.indexes if index.name == name)
+        with connection.schema_editor() as editor:
+            return str(index.create_sql(Company, editor))
+
+    @skipUnless(connection.vendor == 'postgresql', 'GIN trigram indexes need Postgres')
+    def test_indexes_are_on_upper_expressions(self):
+        self.assertIn('UPPER("name") gin_trgm_ops', self.index_sql('company_name_trgm'))
+        self.assertIn('UPPER("city") gin_trgm_ops', self.index_sql('company_city_trgm'))
+
+    @skipUnless(connection.vendor == 'postgresql', 'GIN trigram indexes need Postgres')
+    def test_icontains_search_uses_trigram_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        self.assertIn('company_name_trgm', Company.objects.filter(name__icontains='hexa').explain())
+        self.assertIn('company_city_trgm', Company.objects.filter(city__icontains='pune').explain())
+
+
+class CompanyToggleStatusTests(APITestCase):
+    """toggle-status resolves the company through get_object() before the UPDATE"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='toggle')
+        cls.company = Company.objects.create(name='Hexa', company_code='HEXA001')
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/companies/{self.company.pk}/toggle-status/'
+
+    def test_toggle_flips_is_active(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url)
+        self.assertEqual(response.data['id'], self.company.pk)
+        self.assertIs(response.data['is_active'], False)
+        self.company.refresh_from_db()
+        self.assertFalse(self.company.is_active)
+
+    def test_toggle_checks_object_permissions(self):
+        with mock.patch.object(CompanyViewSet, 'check_object_permissions') as check:
+            self.client.post(self.url)
+        self.assertEqual(check.call_args.args[1], self.company)
+
+    def test_toggle_unknown_pk_is_404(self):
+        response = self.client.post(f'/api/v1/companies/{self.company.pk + 1}/toggle-status/')
+        self.assertEqual(response.status_code, 404)
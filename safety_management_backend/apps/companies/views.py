@@ -1,8 +1,10 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models import Q, Count
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
 
@@ -12,8 +14,11 @@ from .serializers import (
     CompanyListSerializer,
     CompanyCreateUpdateSerializer
 )
+from apps.common.cache_keys import DASHBOARD_CACHE_TIMEOUT, COMPANY_DASHBOARD_CACHE_KEY
+from apps.common.db import toggle_flag
+from apps.common.pagination import PaginatedActionMixin
 
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing companies (headquarters)
     """
@@ -37,6 +42,13 @@ class CompanyViewSet(viewsets.ModelViewSet):
         """Filter queryset based on query parameters"""
         queryset = super().get_queryset()
 
+        # Only load the columns CompanyListSerializer renders
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'name', 'company_code', 'company_type',
+                'city', 'state', 'country', 'is_active', 'created_at'
+            )
+
         # Filter by active companies only if specified
         active_only = self.request.query_params.get('active_only')
         if active_only and active_only.lower() == 'true':
@@ -53,19 +65,24 @@ class CompanyViewSet(viewsets.ModelViewSet):
     def headquarters(self, request):
         """Get all headquarters companies"""
         headquarters = self.get_queryset().filter(company_type='HEADQUARTERS')
-        serializer = self.get_serializer(headquarters, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(headquarters)
 
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for companies"""
-        total_companies = Company.objects.count()
-        active_companies = Company.objects.filter(is_active=True).count()
-        headquarters_count = Company.objects.filter(company_type='HEADQUARTERS').count()
-        
-        # Recent activity
+        stats = cache.get_or_set(COMPANY_DASHBOARD_CACHE_KEY, self._dashboard_stats, DASHBOARD_CACHE_TIMEOUT)
+        return Response(stats)
+
+    def _dashboard_stats(self):
+        """Compute dashboard statistics for companies"""
+        # Headline counts and recent activity in a single aggregate query
         last_30_days = timezone.now() - timedelta(days=30)
-        recent_companies = Company.objects.filter(created_at__gte=last_30_days).count()
+        counts = Company.objects.aggregate(
+            total_companies=Count('id'),
+            active_companies=Count('id', filter=Q(is_active=True)),
+            headquarters_count=Count('id', filter=Q(company_type='HEADQUARTERS')),
+            recent_companies=Count('id', filter=Q(created_at__gte=last_30_days))
+        )
         
         # State distribution
         state_distribution = Company.objects.values('state').annotate(
@@ -73,26 +90,32 @@ class CompanyViewSet(viewsets.ModelViewSet):
         ).order_by('-count')[:5]
         
         stats = {
-            'total_companies': total_companies,
-            'active_companies': active_companies,
-            'headquarters_count': headquarters_count,
-            'recent_companies': recent_companies,
+            'total_companies': counts['total_companies'],
+            'active_companies': counts['active_companies'],
+            'headquarters_count': counts['headquarters_count'],
+            'recent_companies': counts['recent_companies'],
             'state_distribution': list(state_distribution)
         }
         
-        return Response(stats)
+        return stats
 
     @action(detail=True, methods=['post'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
         """Toggle company active status"""
+        # get_object() applies the lookup, filtering and object permissions; the
+        # flip itself is one narrow UPDATE instead of saving every column
         company = self.get_object()
-        company.is_active = not company.is_active
-        company.save()
+        is_active = toggle_flag(self.get_queryset(), company.pk, 'is_active', current=company.is_active)
+        if is_active is None:
+            raise NotFound()
+
+        # update() skips post_save, so drop the cached dashboard stats here
+        cache.delete(COMPANY_DASHBOARD_CACHE_KEY)
         
         return Response({
-            'id': company.id,
-            'is_active': company.is_active,
-            'message': f"Company {'activated' if company.is_active else 'deactivated'} successfully"
+            'id': company.pk,
+            'is_active': is_active,
+            'message': f"Company {'activated' if is_active else 'deactivated'} successfully"
         })
 
     def perform_create(self, serializer):
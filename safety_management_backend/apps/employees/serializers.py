@@ -1,8 +1,22 @@
+from django.db import models
 from rest_framework import serializers
 from .models import Employee, EmployeeAssignment
 from apps.companies.serializers import CompanySerializer
 from apps.sites.serializers import SiteSerializer
 
+class EmployeeCompanyListSerializer(serializers.ListSerializer):
+    """
+    List serializer that loads every employee's company in one query, so
+    many=True callers don't need to remember select_related('company')
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        employees = list(iterable)
+        # No-op for instances whose company is already cached
+        models.prefetch_related_objects(employees, 'company')
+        return super().to_representation(employees)
+
 class EmployeeSerializer(serializers.ModelSerializer):
     """Full serializer for Employee model"""
     company = CompanySerializer(read_only=True)
@@ -11,6 +25,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Employee
         fields = '__all__'
+        list_serializer_class = EmployeeCompanyListSerializer
         read_only_fields = ('created_at', 'updated_at')
     
     def to_representation(self, instance):
@@ -42,12 +57,9 @@ class EmployeeCreateUpdateSerializer(serializers.ModelSerializer):
             'phone', 'email', 'emergency_contact_name', 'emergency_contact_phone',
             'emergency_contact_relationship', 'is_active'
         ]
-    
-    def validate_employee_id(self, value):
-        """Validate employee ID uniqueness"""
-        if Employee.objects.filter(employee_id=value).exists():
-            raise serializers.ValidationError("Employee ID must be unique.")
-        return value
+        # employee_id uniqueness is left to the DB constraint rather than a
+        # pre-check query per write; see EmployeeViewSet.save_unique
+        extra_kwargs = {'employee_id': {'validators': []}}
 
 class EmployeeAssignmentSerializer(serializers.ModelSerializer):
     """Serializer for employee assignments"""
@@ -1,3 +1,170 @@
-from django.test import TestCase
+from unittest import mock
+from django.contrib.auth.models import User
+from rest_framework import serializers
+from rest_framework.test import APITestCase
+from apps.companies.models import Company
+from apps.sites.models import Site
+from .models import Employee, EmployeeAssignment
+from .serializers import EmployeeSerializer
+from .views import EmployeeAssignmentViewSet, EmployeeViewSet
 
-# Create your tests here.
+
+class UniqueEmployeeSerializer(serializers.ModelSerializer):
+    """employee_id with DRF's default UniqueValidator, for comparing error payloads"""
+
+    class Meta:
+        model = Employee
+        fields = ['employee_id']
+
+
+class EmployeeUniqueIdTests(APITestCase):
+    """Duplicate employee_ids are caught by the DB constraint and reported as a 400"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='employees')
+        cls.company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.employee = Employee.objects.create(
+            company=cls.company, name='Asha', employee_id='E001', position='Engineer',
+            phone='123', email='asha@example.com'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def payload(self, employee_id):
+        return {
+            'company': self.company.pk, 'name': 'Ravi', 'employee_id': employee_id,
+            'position': 'Technician', 'phone': '456', 'email': 'ravi@example.com',
+        }
+
+    def expected_errors(self, employee_id):
+        serializer = UniqueEmployeeSerializer(data={'employee_id': employee_id})
+        serializer.is_valid()
+        return serializer.errors
+
+    def test_duplicate_on_create_is_400(self):
+        response = self.client.post('/api/v1/employees/', self.payload('E001'), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, self.expected_errors('E001'))
+        self.assertEqual(Employee.objects.count(), 1)
+
+    def test_duplicate_on_update_is_400(self):
+        other = Employee.objects.create(
+            company=self.company, name='Ravi', employee_id='E002', position='Technician',
+            phone='456', email='ravi@example.com'
+        )
+        response = self.client.put(f'/api/v1/employees/{other.pk}/', self.payload('E001'), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, self.expected_errors('E001'))
+
+    def test_unique_id_is_created(self):
+        response = self.client.post('/api/v1/employees/', self.payload('E002'), format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Employee.objects.filter(employee_id='E002').exists())
+
+
+class EmployeeToggleStatusTests(APITestCase):
+    """toggle-status resolves the employee through get_object() before the UPDATE"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='toggle')
+        company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.employee = Employee.objects.create(
+            company=company, name='Asha', employee_id='E001', position='Engineer',
+            phone='123', email='asha@example.com'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/employees/{self.employee.pk}/toggle-status/'
+
+    def test_toggle_flips_is_active(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url)
+        self.assertEqual(response.data['id'], self.employee.pk)
+        self.assertIs(response.data['is_active'], False)
+        self.employee.refresh_from_db()
+        self.assertFalse(self.employee.is_active)
+
+    def test_toggle_checks_object_permissions(self):
+        with mock.patch.object(EmployeeViewSet, 'check_object_permissions') as check:
+            self.client.post(self.url)
+        self.assertEqual(check.call_args.args[1], self.employee)
+
+    def test_toggle_unknown_pk_is_404(self):
+        response = self.client.post(f'/api/v1/employees/{self.employee.pk + 1}/toggle-status/')
+        self.assertEqual(response.status_code, 404)
+
+
+class EmployeeAssignmentToggleTests(APITestCase):
+    """Assignment toggles flip one column with a narrow UPDATE instead of save()"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='assignments')
+        company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        employee = Employee.objects.create(
+            company=company, name='Asha', employee_id='E001', position='Engineer',
+            phone='123', email='asha@example.com'
+        )
+        site = Site.objects.create(name='North', site_code='N1', company=company)
+        cls.assignment = EmployeeAssignment.objects.create(employee=employee, site=site)
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def url(self, action, pk=None):
+        return f'/api/v1/employee-assignments/{pk or self.assignment.pk}/{action}/'
+
+    def test_toggle_primary(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url('toggle-primary'))
+        self.assertEqual(response.data['id'], self.assignment.pk)
+        self.assertIs(response.data['is_primary'], True)
+        self.assignment.refresh_from_db()
+        self.assertTrue(self.assignment.is_primary)
+
+    def test_toggle_active(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url('toggle-active'))
+        self.assertIs(response.data['is_active'], False)
+        self.assignment.refresh_from_db()
+        self.assertFalse(self.assignment.is_active)
+
+    def test_toggle_skips_save(self):
+        with mock.patch.object(EmployeeAssignment, 'save') as save:
+            self.client.post(self.url('toggle-active'))
+        save.assert_not_called()
+
+    def test_toggle_checks_object_permissions(self):
+        with mock.patch.object(EmployeeAssignmentViewSet, 'check_object_permissions') as check:
+            self.client.post(self.url('toggle-primary'))
+        self.assertEqual(check.call_args.args[1], self.assignment)
+
+    def test_toggle_unknown_pk_is_404(self):
+        response = self.client.post(self.url('toggle-active', self.assignment.pk + 1))
+        self.assertEqual(response.status_code, 404)
+
+
+class EmployeeSerializerManyTests(APITestCase):
+    """EmployeeSerializer(many=True) batch-loads the nested companies"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for code in ('HEXA001', 'HEXA002', 'HEXA003'):
+            company = Company.objects.create(name=code, company_code=code)
+            Employee.objects.create(
+                company=company, name=f'Employee {code}', employee_id=f'E-{code}',
+                position='Engineer', phone='123', email='e@example.com'
+            )
+
+    def test_plain_queryset_takes_two_queries(self):
+        with self.assertNumQueries(2):
+            data = EmployeeSerializer(Employee.objects.all(), many=True).data
+        self.assertEqual(sorted(row['company']['company_code'] for row in data), ['HEXA001', 'HEXA002', 'HEXA003'])
+
+    def test_select_related_adds_no_query(self):
+        with self.assertNumQueries(1):
+            EmployeeSerializer(Employee.objects.select_related('company'), many=True).data
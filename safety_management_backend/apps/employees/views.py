@@ -1,8 +1,10 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
+from django.db import IntegrityError, transaction
 from django.db.models import Q, Count
 from django.utils import timezone
 from datetime import timedelta
@@ -17,8 +19,10 @@ from .serializers import (
 )
 from apps.companies.models import Company
 from apps.sites.models import Site
+from apps.common.db import approx_count, toggle_flag
+from apps.common.pagination import PaginatedActionMixin
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(PaginatedActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing employees
     """
@@ -52,14 +56,28 @@ class EmployeeViewSet(viewsets.ModelViewSet):
         if active_only and active_only.lower() == 'true':
             queryset = queryset.filter(is_active=True)
 
+        # Only load the columns EmployeeListSerializer renders
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'name', 'employee_id', 'position', 'employment_type',
+                'phone', 'email', 'is_active', 'created_at', 'company__name'
+            )
+
+        # EmergencyContactSerializer needs neither the company nor the bookkeeping columns
+        if self.action in ('emergency_contacts', 'emergency_contacts_by_site', 'emergency_contacts_by_company'):
+            queryset = queryset.select_related(None).only(
+                'id', 'name', 'position', 'phone', 'email',
+                'emergency_contact_name', 'emergency_contact_phone',
+                'emergency_contact_relationship'
+            )
+
         return queryset
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts')
     def emergency_contacts(self, request):
         """Get all emergency contacts"""
         employees = self.get_queryset().filter(is_active=True)
-        serializer = EmergencyContactSerializer(employees, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(employees, EmergencyContactSerializer)
 
     @action(detail=False, methods=['get'], url_path='emergency-contacts-by-site/(?P<site_id>[^/.]+)')
     def emergency_contacts_by_site(self, request, site_id=None):
@@ -76,8 +94,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 id__in=assigned_employees,
                 is_active=True
             )
-            serializer = EmergencyContactSerializer(employees, many=True)
-            return Response(serializer.data)
+            return self.paginated_response(employees, EmergencyContactSerializer)
         except Site.DoesNotExist:
             return Response(
                 {'error': 'Site not found'},
@@ -93,8 +110,7 @@ class EmployeeViewSet(viewsets.ModelViewSet):
                 company=company,
                 is_active=True
             )
-            serializer = EmergencyContactSerializer(employees, many=True)
-            return Response(serializer.data)
+            return self.paginated_response(employees, EmergencyContactSerializer)
         except Company.DoesNotExist:
             return Response(
                 {'error': 'Company not found'},
@@ -104,20 +120,23 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
         """Toggle employee active status"""
+        # get_object() applies the lookup, filtering and object permissions; the
+        # flip itself is one narrow UPDATE instead of saving every column
         employee = self.get_object()
-        employee.is_active = not employee.is_active
-        employee.save()
+        is_active = toggle_flag(self.get_queryset(), employee.pk, 'is_active', current=employee.is_active)
+        if is_active is None:
+            raise NotFound()
         
         return Response({
-            'id': employee.id,
-            'is_active': employee.is_active,
-            'message': f"Employee {'activated' if employee.is_active else 'deactivated'} successfully"
+            'id': employee.pk,
+            'is_active': is_active,
+            'message': f"Employee {'activated' if is_active else 'deactivated'} successfully"
         })
 
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for employees"""
-        total_employees = Employee.objects.count()
+        total_employees = approx_count(Employee)
         active_employees = Employee.objects.filter(is_active=True).count()
         
         # Employment type distribution
@@ -140,14 +159,31 @@ class EmployeeViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Custom create logic"""
-        employee = serializer.save()
+        employee = self.save_unique(serializer)
         return employee
 
     def perform_update(self, serializer):
         """Custom update logic"""
-        employee = serializer.save()
+        employee = self.save_unique(serializer)
         return employee
 
+    def save_unique(self, serializer):
+        """Save, turning a duplicate employee_id rejected by the DB into a 400"""
+        try:
+            with transaction.atomic():
+                return serializer.save()
+        except IntegrityError:
+            # Only the failure path pays for the lookup
+            employee_id = serializer.validated_data.get('employee_id')
+            duplicates = Employee.objects.filter(employee_id=employee_id)
+            if serializer.instance is not None:
+                duplicates = duplicates.exclude(pk=serializer.instance.pk)
+            if employee_id and duplicates.exists():
+                raise ValidationError(
+                    {'employee_id': ['employee with this employee id already exists.']}, code='unique'
+                )
+            raise
+
     def perform_destroy(self, instance):
         """Custom delete logic"""
         instance.delete()
@@ -167,29 +203,34 @@ class EmployeeAssignmentViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], url_path='toggle-primary')
     def toggle_primary(self, request, pk=None):
         """Toggle primary assignment status"""
-        assignment = self.get_object()
-        assignment.is_primary = not assignment.is_primary
-        assignment.save()
+        assignment, is_primary = self._toggle_flag('is_primary')
         
         return Response({
-            'id': assignment.id,
-            'is_primary': assignment.is_primary,
-            'message': f"Assignment {'set as primary' if assignment.is_primary else 'removed as primary'} successfully"
+            'id': assignment.pk,
+            'is_primary': is_primary,
+            'message': f"Assignment {'set as primary' if is_primary else 'removed as primary'} successfully"
         })
 
     @action(detail=True, methods=['post'], url_path='toggle-active')
     def toggle_active(self, request, pk=None):
         """Toggle assignment active status"""
-        assignment = self.get_object()
-        assignment.is_active = not assignment.is_active
-        assignment.save()
+        assignment, is_active = self._toggle_flag('is_active')
         
         return Response({
-            'id': assignment.id,
-            'is_active': assignment.is_active,
-            'message': f"Assignment {'activated' if assignment.is_active else 'deactivated'} successfully"
+            'id': assignment.pk,
+            'is_active': is_active,
+            'message': f"Assignment {'activated' if is_active else 'deactivated'} successfully"
         })
 
+    def _toggle_flag(self, field):
+        """Flip a boolean column on the requested assignment with a single narrow UPDATE; returns (assignment, new value)"""
+        # get_object() applies the viewset's lookup, filtering and object permissions
+        assignment = self.get_object()
+        value = toggle_flag(self.get_queryset(), assignment.pk, field, current=getattr(assignment, field))
+        if value is None:
+            raise NotFound()
+        return assignment, value
+
     def perform_create(self, serializer):
         """Custom create logic"""
         assignment = serializer.save()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(fields=['-created_at'], name='incident_created_desc_idx'),
+        ),
+    ]
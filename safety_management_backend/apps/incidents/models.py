@@ -62,6 +62,10 @@ class Incident(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Matches the default ordering so list pages skip the sort
+            models.Index(fields=['-created_at'], name='incident_created_desc_idx'),
+        ]
     
     def __str__(self):
         return f"{self.title} - {self.site.name}"
@@ -17,6 +17,7 @@ from .serializers import (
     IncidentAssignmentSerializer
 )
 from apps.employees.models import Employee
+from apps.common.db import approx_count
 
 class IncidentViewSet(viewsets.ModelViewSet):
     """
@@ -70,6 +71,15 @@ class IncidentViewSet(viewsets.ModelViewSet):
         if end_date:
             queryset = queryset.filter(created_at__lte=end_date)
 
+        # IncidentListSerializer reads the site's company name, and none of the
+        # description/actions/recommendations text columns
+        if self.action == 'list':
+            queryset = queryset.select_related('site__company').only(
+                'id', 'title', 'incident_type', 'severity', 'status',
+                'reported_by', 'incident_date', 'created_at',
+                'site__name', 'site__company__name', 'assigned_to__name'
+            )
+
         return queryset
 
     @action(detail=False, methods=['post'], url_path='anonymous')
@@ -107,7 +117,7 @@ class IncidentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for incidents"""
-        total_incidents = Incident.objects.count()
+        total_incidents = approx_count(Incident)
         open_incidents = Incident.objects.filter(status__in=['OPEN', 'IN_PROGRESS']).count()
         resolved_incidents = Incident.objects.filter(status='RESOLVED').count()
         closed_incidents = Incident.objects.filter(status='CLOSED').count()
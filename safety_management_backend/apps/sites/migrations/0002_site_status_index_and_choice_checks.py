@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='site',
+            index=models.Index(fields=['is_active', 'operational_status'], name='site_active_status_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='site',
+            constraint=models.CheckConstraint(check=models.Q(('plant_type__in', ['SOLAR', 'WIND', 'HYDRO', 'THERMAL', 'OTHER'])), name='site_plant_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='site',
+            constraint=models.CheckConstraint(check=models.Q(('operational_status__in', ['OPERATIONAL', 'MAINTENANCE', 'SHUTDOWN', 'PLANNING'])), name='site_operational_status_valid'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_site_status_index_and_choice_checks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='site',
+            index=models.Index(fields=['-created_at'], name='site_created_desc_idx'),
+        ),
+    ]
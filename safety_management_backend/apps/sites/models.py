@@ -1,9 +1,6 @@
 from django.db import models
 from django.utils import timezone
-from apps.companies.models import Company
-import qrcode
-import base64
-from io import BytesIO
+from apps.companies.models import Company, qr_image_url
 
 class Site(models.Model):
     """
@@ -57,6 +54,21 @@ class Site(models.Model):
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['is_active', 'operational_status'], name='site_active_status_idx'),
+            # Matches SiteViewSet's default ordering so list pages skip the sort
+            models.Index(fields=['-created_at'], name='site_created_desc_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(plant_type__in=['SOLAR', 'WIND', 'HYDRO', 'THERMAL', 'OTHER']),
+                name='site_plant_type_valid',
+            ),
+            models.CheckConstraint(
+                check=models.Q(operational_status__in=['OPERATIONAL', 'MAINTENANCE', 'SHUTDOWN', 'PLANNING']),
+                name='site_operational_status_valid',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.site_code})"
@@ -76,23 +88,14 @@ class Site(models.Model):
         except SiteConfiguration.DoesNotExist:
             return ['UNSAFE_ACT', 'UNSAFE_CONDITION', 'NEAR_MISS']
     
-    def generate_qr_data(self, qr_type='orm'):
+    def generate_qr_data(self, qr_type='orm', request=None):
         """Generate QR code data for the site"""
         if qr_type == 'url':
             # Generate URL-based QR code
             qr_url = f"http://localhost:3000/public/{self.company.company_code}/{self.site_code}"
-            qr = qrcode.QRCode(version=1, box_size=10, border=5)
-            qr.add_data(qr_url)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            qr_code = base64.b64encode(buffer.getvalue()).decode()
             
             return {
-                'qr_code': qr_code,
-                'qr_code_image': f"data:image/png;base64,{qr_code}",
+                'qr_code_url': qr_image_url(qr_url, request),
                 'url': qr_url
             }
         else:
@@ -104,18 +107,9 @@ class Site(models.Model):
                 'company_name': self.company.name
             }
             
-            qr = qrcode.QRCode(version=1, box_size=10, border=5)
-            qr.add_data(str(qr_data))
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            buffer = BytesIO()
-            img.save(buffer, format='PNG')
-            qr_code = base64.b64encode(buffer.getvalue()).decode()
             
             return {
-                'qr_code': qr_code,
-                'qr_code_image': f"data:image/png;base64,{qr_code}",
+                'qr_code_url': qr_image_url(str(qr_data), request),
                 'data': qr_data
             }
 
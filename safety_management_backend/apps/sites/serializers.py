@@ -9,7 +9,13 @@ class SiteSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Site
-        fields = '__all__'
+        fields = [
+            'id', 'company', 'company_id', 'name', 'site_code', 'description',
+            'address', 'city', 'state', 'country', 'postal_code',
+            'latitude', 'longitude', 'phone', 'email',
+            'plant_type', 'capacity', 'operational_status', 'is_active',
+            'created_at', 'updated_at'
+        ]
         read_only_fields = ('created_at', 'updated_at')
     
     def to_representation(self, instance):
@@ -45,12 +51,6 @@ class SiteCreateUpdateSerializer(serializers.ModelSerializer):
             'latitude', 'longitude', 'phone', 'email',
             'plant_type', 'capacity', 'operational_status', 'is_active'
         ]
-    
-    def validate_site_code(self, value):
-        """Validate site code uniqueness"""
-        if Site.objects.filter(site_code=value).exists():
-            raise serializers.ValidationError("Site code must be unique.")
-        return value
 
 class SiteQRSerializer(serializers.ModelSerializer):
     """Serializer for QR code generation"""
@@ -64,9 +64,7 @@ class SiteQRSerializer(serializers.ModelSerializer):
     def to_representation(self, instance):
         """Include QR code data"""
         data = super().to_representation(instance)
-        qr_data = instance.generate_qr_data()
-        data['qr_code'] = qr_data['qr_code']
-        data['qr_code_image'] = qr_data['qr_code_image']
+        data['qr_code_url'] = instance.generate_qr_data(request=self.context.get('request'))['qr_code_url']
         return data
 
 class PublicSiteSerializer(serializers.ModelSerializer):
@@ -0,0 +1,19 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from apps.companies.models import Company
+from .models import Site, SiteConfiguration
+from apps.common.cache_keys import SITE_DASHBOARD_CACHE_KEY
+from .views import invalidate_public_sites
+
+@receiver([post_save, post_delete], sender=Site)
+def invalidate_site_dashboard_stats(sender, **kwargs):
+    """Drop the cached site dashboard stats whenever a site changes"""
+    cache.delete(SITE_DASHBOARD_CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Site)
+@receiver([post_save, post_delete], sender=SiteConfiguration)
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_public_site_payloads(sender, **kwargs):
+    """Public site payloads include site, configuration and company fields"""
+    invalidate_public_sites()
@@ -1,3 +1,78 @@
-from django.test import TestCase
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+from apps.companies.models import Company
+from .models import Site
+from .views import PUBLIC_SITE_GENERATION_KEY, SiteViewSet, public_site_cache_key
 
-# Create your tests here.
+
+class PublicSiteCacheTests(APITestCase):
+    """Cached public QR-scan payloads are dropped on site and company writes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.site = Site.objects.create(name='North', site_code='N1', company=cls.company)
+
+    def setUp(self):
+        cache.clear()
+        self.url = '/api/v1/public/public/HEXA001/N1/'
+
+    def test_repeat_scan_is_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['site']['name'], 'North')
+
+    def test_site_rename_invalidates_payload(self):
+        self.client.get(self.url)
+        self.site.name = 'North Plant'
+        self.site.save()
+        self.assertEqual(self.client.get(self.url).data['site']['name'], 'North Plant')
+
+    def test_deactivated_site_is_not_served(self):
+        self.client.get(self.url)
+        self.site.is_active = False
+        self.site.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {'error': 'Site not found or inactive'})
+
+    def test_company_write_replaces_generation(self):
+        key = public_site_cache_key('HEXA001', 'N1')
+        self.company.name = 'Hexa Climate'
+        self.company.save()
+        self.assertNotEqual(public_site_cache_key('HEXA001', 'N1'), key)
+        self.assertIsNotNone(cache.get(PUBLIC_SITE_GENERATION_KEY))
+
+
+class SiteToggleStatusTests(APITestCase):
+    """toggle-status resolves the site through get_object() before the UPDATE"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='toggle')
+        company = Company.objects.create(name='Hexa', company_code='HEXA001')
+        cls.site = Site.objects.create(name='North', site_code='N1', company=company)
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+        self.url = f'/api/v1/sites/{self.site.pk}/toggle-status/'
+
+    def test_toggle_flips_is_active(self):
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url)
+        self.assertEqual(response.data['id'], self.site.pk)
+        self.assertIs(response.data['is_active'], False)
+        self.site.refresh_from_db()
+        self.assertFalse(self.site.is_active)
+
+    def test_toggle_checks_object_permissions(self):
+        with mock.patch.object(SiteViewSet, 'check_object_permissions') as check:
+            self.client.post(self.url)
+        self.assertEqual(check.call_args.args[1], self.site)
+
+    def test_toggle_unknown_pk_is_404(self):
+        response = self.client.post(f'/api/v1/sites/{self.site.pk + 1}/toggle-status/')
+        self.assertEqual(response.status_code, 404)
@@ -1,10 +1,12 @@
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from django.db.models import Q, Count
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
@@ -12,9 +14,7 @@ import logging
 from datetime import timedelta
 from django.utils import timezone
 import json
-import qrcode
-from io import BytesIO
-import base64
+import time
 
 from .models import Site, SiteConfiguration
 from .serializers import (
@@ -27,10 +27,28 @@ from .serializers import (
     SiteFormConfigurationSerializer
 )
 from apps.companies.models import Company
+from apps.common.cache_keys import DASHBOARD_CACHE_TIMEOUT, SITE_DASHBOARD_CACHE_KEY
+from apps.common.db import toggle_flag
 from .utils import reverse_geocode, validate_coordinates, geocode_address
 
 logger = logging.getLogger(__name__)
 
+# Public QR-scan payloads are read on every scan. Entries are namespaced by a
+# generation token that any site, configuration or company write replaces (see
+# signals.py). That only reaches other workers through a shared cache
+# (REDIS_URL), so entries are also kept short: a deactivated or renamed site is
+# never served for longer than this, whatever the cache backend.
+PUBLIC_SITE_CACHE_TIMEOUT = 30
+PUBLIC_SITE_GENERATION_KEY = 'sites:public:generation'
+
+def public_site_cache_key(company_code, site_code):
+    generation = cache.get_or_set(PUBLIC_SITE_GENERATION_KEY, time.time_ns, None)
+    return f'sites:public:{generation}:{company_code}:{site_code}'
+
+def invalidate_public_sites():
+    """Orphan every cached public site payload"""
+    cache.set(PUBLIC_SITE_GENERATION_KEY, time.time_ns(), None)
+
 class SiteViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing sites with full CRUD operations
@@ -76,28 +94,35 @@ class SiteViewSet(viewsets.ModelViewSet):
                 operational_status='OPERATIONAL'
             )
 
+        # Only load the columns SiteListSerializer renders
+        if self.action == 'list':
+            queryset = queryset.only(
+                'id', 'name', 'site_code', 'city', 'state', 'plant_type',
+                'operational_status', 'is_active', 'created_at',
+                'company__name', 'company__company_code'
+            )
+
         return queryset
 
     @action(detail=True, methods=['get'], url_path='qr')
     def generate_qr(self, request, pk=None):
         """Generate QR code for specific site"""
         site = self.get_object()
-        serializer = SiteQRSerializer(site)
+        serializer = SiteQRSerializer(site, context=self.get_serializer_context())
         return Response(serializer.data)
 
     @action(detail=True, methods=['get'], url_path='qr-url')
     def generate_url_qr(self, request, pk=None):
         """Generate URL-based QR code for specific site"""
         site = self.get_object()
-        qr_data = site.generate_qr_data(qr_type='url')
+        qr_data = site.generate_qr_data(qr_type='url', request=request)
         return Response({
             'id': site.id,
             'name': site.name,
             'site_code': site.site_code,
             'company_name': site.company.name,
             'company_code': site.company.company_code,
-            'qr_code': qr_data['qr_code'],
-            'qr_code_image': qr_data['qr_code_image'],
+            'qr_code_url': qr_data['qr_code_url'],
             'url': qr_data['url']
         })
 
@@ -115,16 +140,19 @@ class SiteViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='dashboard-stats')
     def dashboard_stats(self, request):
         """Get dashboard statistics for sites"""
-        total_sites = Site.objects.count()
-        active_sites = Site.objects.filter(is_active=True).count()
-        operational_sites = Site.objects.filter(
-            is_active=True, 
-            operational_status='OPERATIONAL'
-        ).count()
-        
-        # Recent activity
+        stats = cache.get_or_set(SITE_DASHBOARD_CACHE_KEY, self._dashboard_stats, DASHBOARD_CACHE_TIMEOUT)
+        return Response(stats)
+
+    def _dashboard_stats(self):
+        """Compute dashboard statistics for sites"""
+        # Headline counts and recent activity in a single aggregate query
         last_30_days = timezone.now() - timedelta(days=30)
-        recent_sites = Site.objects.filter(created_at__gte=last_30_days).count()
+        counts = Site.objects.aggregate(
+            total_sites=Count('id'),
+            active_sites=Count('id', filter=Q(is_active=True)),
+            operational_sites=Count('id', filter=Q(is_active=True, operational_status='OPERATIONAL')),
+            recent_sites=Count('id', filter=Q(created_at__gte=last_30_days))
+        )
         
         # Plant type distribution
         plant_distribution = Site.objects.values('plant_type').annotate(
@@ -137,27 +165,34 @@ class SiteViewSet(viewsets.ModelViewSet):
         ).order_by('-count')[:5]
         
         stats = {
-            'total_sites': total_sites,
-            'active_sites': active_sites,
-            'operational_sites': operational_sites,
-            'recent_sites': recent_sites,
+            'total_sites': counts['total_sites'],
+            'active_sites': counts['active_sites'],
+            'operational_sites': counts['operational_sites'],
+            'recent_sites': counts['recent_sites'],
             'plant_distribution': list(plant_distribution),
             'state_distribution': list(state_distribution)
         }
         
-        return Response(stats)
+        return stats
 
     @action(detail=True, methods=['post'], url_path='toggle-status')
     def toggle_status(self, request, pk=None):
         """Toggle site active status"""
+        # get_object() applies the lookup, filtering and object permissions; the
+        # flip itself is one narrow UPDATE instead of saving every column
         site = self.get_object()
-        site.is_active = not site.is_active
-        site.save()
+        is_active = toggle_flag(self.get_queryset(), site.pk, 'is_active', current=site.is_active)
+        if is_active is None:
+            raise NotFound()
+
+        # update() skips post_save, so drop the cached stats and public payloads here
+        cache.delete(SITE_DASHBOARD_CACHE_KEY)
+        invalidate_public_sites()
         
         return Response({
-            'id': site.id,
-            'is_active': site.is_active,
-            'message': f"Site {'activated' if site.is_active else 'deactivated'} successfully"
+            'id': site.pk,
+            'is_active': is_active,
+            'message': f"Site {'activated' if is_active else 'deactivated'} successfully"
         })
 
     @action(detail=True, methods=['patch'], url_path='update-status')
@@ -323,22 +358,26 @@ class PublicSiteAccessView(viewsets.ReadOnlyModelViewSet):
                     }
                 })
             
-            # Get site by company code and site code
-            site = get_object_or_404(
-                Site.objects.select_related('company'),
-                company__company_code=company_code,
-                site_code=site_code,
-                is_active=True
-            )
+            cache_key = public_site_cache_key(company_code, site_code)
+            site_data = cache.get(cache_key)
+            if site_data is None:
+                # Get site by company code and site code
+                site = Site.objects.select_related('company', 'siteconfiguration').filter(
+                    company__company_code=company_code,
+                    site_code=site_code,
+                    is_active=True
+                ).first()
+                if site is None:
+                    return Response(
+                        {'error': 'Site not found or inactive'},
+                        status=status.HTTP_404_NOT_FOUND
+                    )
+
+                site_data = self.get_serializer(site).data
+                cache.set(cache_key, site_data, PUBLIC_SITE_CACHE_TIMEOUT)
             
-            serializer = self.get_serializer(site)
-            return Response({'site': serializer.data})
+            return Response({'site': site_data})
             
-        except Site.DoesNotExist:
-            return Response(
-                {'error': 'Site not found or inactive'},
-                status=status.HTTP_404_NOT_FOUND
-            )
         except Exception as e:
             logger.error(f"Public site access error: {e}")
             return Response(